@@ -11,7 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import json
+import hashlib
 import os
 import asyncio
 import aiofiles
@@ -23,7 +23,13 @@ import logging
 import textwrap
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional, List, Union
+from typing import Any, Dict, Optional, List, Tuple, Union
+
+from inference_perf.utils import fast_json
+
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with them.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
 logger = logging.getLogger(__name__)
 
@@ -40,42 +46,86 @@ class BenchmarkResult:
     reports: Optional[Dict[str, Any]]  # Parsed json for reports if present
 
 
+# Rendered YAML (without the per-run storage section) keyed by config source,
+# so repeated runs of the same config skip the parse and dump.
+_rendered_configs: Dict[str, str] = {}
+
+
+async def _render_config(config: Union[str, Path, Dict[str, Any]]) -> str:
+    # if config is a Path, then open it as a file.
+    if isinstance(config, Path):
+        async with aiofiles.open(config, mode="r") as file:
+            config = await file.read()
+
+    # if config is (still) a string, then directly parse it as YAML.
+    if isinstance(config, str):
+        config = yaml.load(config, Loader=_YamlLoader)
+        assert isinstance(config, dict)
+
+    config = {k: v for k, v in config.items() if k != "storage"}
+    if not config:
+        return ""
+    return yaml.dump(config, Dumper=_YamlDumper, sort_keys=False, default_flow_style=False)
+
+
 async def _process_yaml_config(config: Union[str, Path, Dict[str, Any]], out_dir: Path) -> Path:
     out_dir.mkdir(parents=True, exist_ok=True)
     cfg_path = out_dir / "config_input.yaml"
 
     # if config is a string pointing to an existing path, then convert it to
     # Path.
+    stat: Optional[os.stat_result] = None
     if isinstance(config, str):
         try:
-            await aiofiles.os.stat(config)
+            stat = await aiofiles.os.stat(config)
             config = Path(config)
         except Exception:
             pass
 
-    # if config is a Path, then open it as a file.
+    # A file is identified by its location and mtime, so edits invalidate it.
     if isinstance(config, Path):
-        async with aiofiles.open(config, mode="r") as file:
-            config = await file.read()
+        stat = stat or await aiofiles.os.stat(config)
+        source = f"path:{config.resolve()}:{stat.st_mtime_ns}:{stat.st_size}"
+    elif isinstance(config, str):
+        source = f"yaml:{config}"
+    else:
+        source = f"dict:{config!r}"
+    key = hashlib.blake2b(source.encode("utf-8"), digest_size=16).hexdigest()
 
-    # if config is (still) a string, then directly parse it as YAML.
-    if isinstance(config, str):
-        config = yaml.safe_load(config)
-        assert isinstance(config, dict)
+    rendered = _rendered_configs.get(key)
+    if rendered is None:
+        rendered = _rendered_configs[key] = await _render_config(config)
 
     # Overwrite output path to temporary folder
-    config["storage"] = {"local_storage": {"path": out_dir.as_posix()}}
+    storage = {"storage": {"local_storage": {"path": out_dir.as_posix()}}}
 
     cfg_path.write_text(
-        yaml.safe_dump(config, sort_keys=False, default_flow_style=False),
+        rendered + yaml.dump(storage, Dumper=_YamlDumper, sort_keys=False, default_flow_style=False),
         encoding="utf-8",
     )
     return cfg_path
 
 
+def _load_report(path: Path) -> Tuple[str, Any]:
+    return path.name, fast_json.loads(path.read_bytes())
+
+
+async def _load_reports(paths: List[Path]) -> Dict[str, Any]:
+    """Read and parse the given report files on the default thread pool, keyed by file name."""
+    return dict(await asyncio.gather(*(asyncio.to_thread(_load_report, path) for path in paths)))
+
+
 def _find_report_files(path: Path) -> Optional[List[Path]]:
     """Return the json reports files under path (if any)."""
-    candidates = list(path.glob("**/*.json"))
+    candidates: List[Path] = []
+    pending = [os.fspath(path)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith(".json"):
+                    candidates.append(Path(entry.path))
     if not candidates:
         return None
     return candidates
@@ -101,9 +151,8 @@ async def run_benchmark_minimal(
     wd = Path(work_dir) if work_dir else Path(tempfile.mkdtemp(prefix="inference-perf-e2e-"))
     cfg_path = await _process_yaml_config(config, wd)
 
-    env = os.environ.copy()
-    if extra_env:
-        env.update({k: str(v) for k, v in extra_env.items()})
+    # Without overrides the child simply inherits this process' environment.
+    env = {**os.environ, **{k: str(v) for k, v in extra_env.items()}} if extra_env else None
 
     if isinstance(executable, str):
         args = [executable]
@@ -148,8 +197,8 @@ async def run_benchmark_minimal(
     success = (return_code == 0) and (not timed_out)
 
     # Attempt to read report.json (optional)
-    report_path = _find_report_files(wd)
-    reports = {report.name: json.loads(report.read_text(encoding="utf-8")) for report in report_path} if report_path else None
+    report_path = await asyncio.to_thread(_find_report_files, wd)
+    reports = await _load_reports(report_path) if report_path else None
 
     return BenchmarkResult(
         success=success,
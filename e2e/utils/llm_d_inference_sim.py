@@ -11,11 +11,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import aiohttp
 import asyncio
+import collections
 import logging
 import sys
-import textwrap
 import shutil
 from contextlib import AsyncContextDecorator
 from typing import Optional
@@ -39,6 +38,9 @@ class LLMDInferenceSimRunner(AsyncContextDecorator):
     _host = "127.0.0.1"
     _port: int
     _proc: "Optional[asyncio.subprocess.Process]" = None
+    _drain_task: "Optional[asyncio.Task[None]]" = None
+    # number of trailing output lines kept in `stdout` once the server exits.
+    _stdout_tail_lines = 200
     _wait_until_ready: bool
 
     def __init__(
@@ -83,6 +85,8 @@ class LLMDInferenceSimRunner(AsyncContextDecorator):
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.STDOUT,
         )
+        # drain output as it arrives so the pipe never fills and stalls the server.
+        self._drain_task = asyncio.create_task(self._drain_stdout())
 
         if self._wait_until_ready:
             try:
@@ -110,49 +114,57 @@ class LLMDInferenceSimRunner(AsyncContextDecorator):
         """Waits until the server is ready to serve requests."""
         assert self._proc
 
-        async def wait_http():
-            async with aiohttp.ClientSession() as http:
-                while True:
-                    try:
-                        async with http.head(f"http://{self._host}:{self._port}") as resp:
-                            await resp.read()
-                            logger.debug(f"querying server's / endpoint returned {resp.status=}")
-                        return True
-                    except (asyncio.exceptions.CancelledError, asyncio.exceptions.TimeoutError):
-                        logger.error(f"llm-d-inference-sim server did not become ready after {timeout_sec}s!")
-                        raise
-                    except Exception as e:
-                        logger.debug(f"http polling error: {e}, retrying...")
-                        await asyncio.sleep(polling_sec)
-                        continue
+        async def wait_port():
+            # any response to a request used to count as ready, so a plain TCP
+            # connect is enough and skips building HTTP requests per poll.
+            while True:
+                try:
+                    _, writer = await asyncio.open_connection(self._host, self._port)
+                except OSError as e:
+                    logger.debug(f"port polling error: {e}, retrying...")
+                    await asyncio.sleep(polling_sec)
+                    continue
+                writer.close()
+                await writer.wait_closed()
+                logger.debug(f"server is accepting connections on port {self._port}")
+                return
 
         async def wait_proc():
             await self._wait()
             raise ConnectionRefusedError("server process exited before port was ready")
 
-        done, pending = await asyncio.wait(
-            [asyncio.create_task(x) for x in [wait_http(), wait_proc()]],
-            return_when=asyncio.FIRST_COMPLETED,
-            timeout=timeout_sec,
-        )
-        [task.cancel() for task in pending]
-        if done:
-            # either client finished polling or process ended early, so read the
-            # result to raise any potential exceptions.
-            [task.result() for task in done]
-        else:
-            # everything timed out, so one of these will have the timeout
-            # exception. await it so it's thrown.
-            [await task for task in pending]
+        try:
+            async with asyncio.timeout(timeout_sec), asyncio.TaskGroup() as tg:
+                # if the process exits early, the group cancels the polling below.
+                exited = tg.create_task(wait_proc())
+                await wait_port()
+                exited.cancel()
+        except TimeoutError:
+            logger.error(f"llm-d-inference-sim server did not become ready after {timeout_sec}s!")
+            raise
+        except ExceptionGroup as eg:
+            # surface the underlying error (e.g. the early exit) rather than the group.
+            raise eg.exceptions[0] from None
+
+    async def _drain_stdout(self) -> None:
+        proc = self._proc
+        assert proc and proc.stdout
+
+        tail: "collections.deque[str]" = collections.deque(maxlen=self._stdout_tail_lines)
+        async for raw in proc.stdout:
+            line = raw.decode(errors="replace").rstrip()
+            tail.append(line)
+            logger.debug(f"  | {line}")
+        self.stdout = "\n".join(tail)
 
     async def _wait(self) -> None:
         proc = self._proc
-        assert proc
+        assert proc and self._drain_task
 
-        stdout, _ = await proc.communicate()
-        self.stdout = stdout.decode()
-        stdout_pretty = textwrap.indent(self.stdout, "  | ")
-        logger.debug(f"server exited with status {proc.returncode}, output:\n{stdout_pretty}")
+        await proc.wait()
+        # shielded so that cancelling a waiter does not stop the draining.
+        await asyncio.shield(self._drain_task)
+        logger.debug(f"server exited with status {proc.returncode}")
 
     async def _terminate(self) -> None:
         proc = self._proc
@@ -13,7 +13,7 @@
 # limitations under the License.
 import os
 import pathlib
-import subprocess
+import tarfile
 
 TEST_E2E_DIR = pathlib.Path(__file__).parent.parent
 TEST_E2E_TESTDATA = TEST_E2E_DIR.joinpath("testdata")
@@ -29,15 +29,14 @@ def extract_tarball(name: str | pathlib.Path) -> pathlib.Path:
     """
     name = pathlib.Path(name).resolve()
 
-    dest = name
-    while dest.suffix:
-        dest = dest.with_suffix("")
+    dest = name.with_name(name.name.split(".", 1)[0])
 
     if not dest.is_dir():
         if not name.is_file():
             raise FileNotFoundError(f"Tarball {name} not found!")
 
         os.makedirs(dest)
-        subprocess.run(["tar", "-xzvf", name, "-C", dest], check=True)
+        with tarfile.open(name, "r:gz") as tarball:
+            tarball.extractall(dest, filter="data")
 
     return dest
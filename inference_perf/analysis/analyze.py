@@ -12,39 +12,360 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 import json
 import logging
-import operator
+import os
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from inference_perf.utils import fast_json
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
 
 logger = logging.getLogger(__name__)
 
 
-def _extract_latency_metric(latency_data: Dict[str, Any], metric_name: str, convert_to_ms: bool = False) -> Optional[float]:
-    """Helper to extract a metric's mean value from latency data."""
-    metric_data = latency_data.get(metric_name)
-    if isinstance(metric_data, dict):
-        mean_val = metric_data.get("mean")
-        if isinstance(mean_val, (int, float)):
-            return mean_val * 1000 if convert_to_ms else mean_val
-    return None
+# Plots generated for every report and for the unified analysis, in the
+# order their chart lists are stored in analyze_reports' chartset. Each entry
+# is (suptitle, filename, skip_if_empty, charts) and each chart names the
+# series collected by analyze_reports that it draws.
+_PLOTS: List[Tuple[str, str, bool, List[Tuple[str, Dict[str, str]]]]] = [
+    (
+        "Latency vs Concurrency",
+        "latency_vs_concurrency.png",
+        False,
+        [
+            (
+                "concurrency_vs_ttft",
+                {"title": "Time to First Token vs. Concurrency", "xlabel": "Concurrency", "ylabel": "Mean TTFT (ms)"},
+            ),
+            (
+                "concurrency_vs_ntpot",
+                {
+                    "title": "Norm. Time per Output Token vs. Concurrency",
+                    "xlabel": "Concurrency",
+                    "ylabel": "Mean Norm. Time (ms/token)",
+                },
+            ),
+            (
+                "concurrency_vs_itl",
+                {"title": "Inter-Token Latency vs. Concurrency", "xlabel": "Concurrency", "ylabel": "Mean ITL (ms)"},
+            ),
+        ],
+    ),
+    (
+        "Throughput vs Concurrency",
+        "throughput_vs_concurrency.png",
+        False,
+        [
+            (
+                "concurrency_vs_itps",
+                {"title": "Input Tokens/sec vs. Concurrency", "xlabel": "Concurrency", "ylabel": "Tokens/sec"},
+            ),
+            (
+                "concurrency_vs_otps",
+                {"title": "Output Tokens/sec vs. Concurrency", "xlabel": "Concurrency", "ylabel": "Tokens/sec"},
+            ),
+            (
+                "concurrency_vs_ttps",
+                {"title": "Total Tokens/sec vs. Concurrency", "xlabel": "Concurrency", "ylabel": "Tokens/sec"},
+            ),
+        ],
+    ),
+    (
+        "Latency vs Request Rate",
+        "latency_vs_qps.png",
+        False,
+        [
+            ("qps_vs_ttft", {"title": "Time to First Token vs. QPS", "ylabel": "Mean TTFT (ms)"}),
+            ("qps_vs_ntpot", {"title": "Norm. Time per Output Token vs. QPS", "ylabel": "Mean Norm. Time (ms/token)"}),
+            ("qps_vs_itl", {"title": "Inter-Token Latency vs. QPS", "ylabel": "Mean ITL (ms)"}),
+        ],
+    ),
+    (
+        "Throughput vs Request Rate",
+        "throughput_vs_qps.png",
+        False,
+        [
+            ("qps_vs_itps", {"title": "Input Tokens/sec vs. QPS", "ylabel": "Tokens/sec"}),
+            ("qps_vs_otps", {"title": "Output Tokens/sec vs. QPS", "ylabel": "Tokens/sec"}),
+            ("qps_vs_ttps", {"title": "Total Tokens/sec vs. QPS", "ylabel": "Tokens/sec"}),
+        ],
+    ),
+    (
+        "Latency vs Throughput",
+        "throughput_vs_latency.png",
+        False,
+        [
+            (
+                "ntpot_vs_otps",
+                {
+                    "title": "Throughput vs. Norm. Time per Output Token",
+                    "xlabel": "Mean Norm. Time (ms/token)",
+                    "ylabel": "Output Tokens/sec",
+                },
+            ),
+            (
+                "ttft_vs_otps",
+                {"title": "Throughput vs. Time to First Token", "xlabel": "Mean TTFT (ms)", "ylabel": "Output Tokens/sec"},
+            ),
+            (
+                "itl_vs_otps",
+                {"title": "Throughput vs. Inter-Token Latency", "xlabel": "Mean ITL (ms)", "ylabel": "Output Tokens/sec"},
+            ),
+        ],
+    ),
+    (
+        "Goodput vs Request Rate",
+        "goodput_vs_qps.png",
+        True,
+        [
+            ("qps_vs_goodput_percentage", {"title": "Goodput % vs. QPS", "ylabel": "Goodput (%)"}),
+            ("qps_vs_request_goodput_rate", {"title": "Request Goodput Rate vs. QPS", "ylabel": "Goodput Rate (req/s)"}),
+        ],
+    ),
+]
+
+# Parsed series are cached per report directory so re-analysis skips JSON
+# parsing. The signature entry records the stage files the cache was built from;
+# bump the version whenever the extracted series change.
+_SERIES_CACHE_FILE = ".analyze_cache.npz"
+_SERIES_CACHE_VERSION = 1
+_SIGNATURE_KEY = "_stage_files"
+
+# Per-thread Figure reused across charts, see _reusable_figure.
+_figures = threading.local()
+
+# Stage values plotted against concurrency (or QPS) and, for the latency
+# values, against output throughput.
+_LATENCY_SERIES = ["ttft", "ntpot", "itl"]
+_THROUGHPUT_SERIES = ["itps", "otps", "ttps"]
+# Stage report keys of the values above, in the same order.
+_LATENCY_METRICS = ["time_to_first_token", "normalized_time_per_output_token", "inter_token_latency"]
+_THROUGHPUT_METRICS = ["input_tokens_per_sec", "output_tokens_per_sec", "total_tokens_per_sec"]
+
+
+def _extract_latency_means_ms(latency_data: Dict[str, Any]) -> List[Optional[float]]:
+    """Extracts the mean of every _LATENCY_METRICS entry, in milliseconds, in one pass."""
+    means: List[Optional[float]] = []
+    for metric_name in _LATENCY_METRICS:
+        metric_data = latency_data.get(metric_name)
+        mean_val = metric_data.get("mean") if isinstance(metric_data, dict) else None
+        means.append(mean_val * 1000 if isinstance(mean_val, (int, float)) else None)
+    return means
+
+
+def _extract_throughputs(throughput_data: Dict[str, Any]) -> List[Optional[float]]:
+    """Extracts every _THROUGHPUT_METRICS value in one pass."""
+    values: List[Optional[float]] = []
+    for metric_name in _THROUGHPUT_METRICS:
+        metric_value = throughput_data.get(metric_name)
+        values.append(float(metric_value) if isinstance(metric_value, (int, float)) else None)
+    return values
+
+
+def _sorted_series(data: List[Tuple[float, float]]) -> NDArray[np.float64]:
+    """Converts (x, y) points into an (N, 2) array ordered by x."""
+    series = np.asarray(data, dtype=np.float64).reshape(-1, 2)
+    return series[np.argsort(series[:, 0], kind="stable")]
+
+
+def _find_stage_files(report_path: Path) -> List[Path]:
+    """Lists the stage_*_lifecycle_metrics.json files directly under report_path."""
+    try:
+        with os.scandir(report_path) as entries:
+            return [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.startswith("stage_") and entry.name.endswith("_lifecycle_metrics.json") and entry.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def _read_file(path: Path) -> bytes:
+    """
+    Reads a whole file with a single sized os.read, bypassing the buffered file
+    object. Falls back to chunked reads if that read comes up short or the size
+    is not reported (e.g. procfs files).
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        if len(data) < size or size == 0:
+            chunks = [data]
+            while chunk := os.read(fd, io.DEFAULT_BUFFER_SIZE):
+                chunks.append(chunk)
+            data = b"".join(chunks)
+        return data
+    finally:
+        os.close(fd)
+
+
+def _parse_stage(stage_file: Path) -> Optional[Dict[str, Any]]:
+    """
+    Reads a stage lifecycle metrics file and reduces it to the values plotted
+    by analyze_reports. Returns None if the stage should be skipped.
+    """
+    try:
+        report_data = fast_json.loads(_read_file(stage_file))
+    except ValueError:
+        logger.error(f"Error decoding JSON from {stage_file.name}")
+        return None
+    except OSError as e:
+        logger.error(f"Error reading {stage_file.name}: {e}")
+        return None
+
+    try:
+        load_summary = report_data.get("load_summary", {})
+        qps = load_summary.get("achieved_rate")
+        if qps is None:
+            logger.warning(f"Could not find achieved_rate in {stage_file.name}. Skipping.")
+            return None
+
+        success_data = report_data.get("successes", {})
+        if not success_data:
+            logger.warning(f"No success data in {stage_file.name}. Skipping.")
+            return None
+
+        metrics: Dict[str, Any] = {
+            "concurrency": load_summary.get("concurrency", None),
+            "qps": qps,
+            "ttft": None,
+            "ntpot": None,
+            "itl": None,
+            "itps": None,
+            "otps": None,
+            "ttps": None,
+            "goodput_percentage": None,
+            "request_goodput_rate": None,
+        }
+
+        # Extract latency metrics if they exist
+        latency_data = success_data.get("latency", {})
+        if latency_data:
+            metrics.update(zip(_LATENCY_SERIES, _extract_latency_means_ms(latency_data), strict=True))
+
+        # Extract throughput metrics if they exist
+        throughput_data = success_data.get("throughput", {})
+        if throughput_data:
+            metrics.update(zip(_THROUGHPUT_SERIES, _extract_throughputs(throughput_data), strict=True))
+
+        # Extract goodput metrics if they exist
+        goodput_metrics = success_data.get("goodput_metrics", {})
+        if goodput_metrics:
+            metrics["goodput_percentage"] = goodput_metrics.get("goodput_percentage")
+            req_goodput_rate = goodput_metrics.get("request_goodput")
+            if req_goodput_rate is None:
+                req_goodput_rate = goodput_metrics.get("request_goodput_rate")
+            metrics["request_goodput_rate"] = req_goodput_rate
+
+        return metrics
+    except (AttributeError, KeyError, TypeError) as e:
+        # Valid JSON with an unexpected shape, e.g. a list where an object is expected.
+        logger.error(f"Unexpected report structure in {stage_file.name}: {e}")
+        return None
+
+
+def _collect_series(stage_files: List[Path]) -> Tuple[Dict[str, List[Tuple[float, float]]], bool]:
+    """
+    Parses the stage files of a report into the (x, y) series plotted by
+    analyze_reports. Also returns whether every stage file could be parsed.
+    """
+    series: Dict[str, List[Tuple[float, float]]] = defaultdict(list)
+
+    # Stage files are independent, so read and reduce them concurrently.
+    with ThreadPoolExecutor(max_workers=min(len(stage_files), os.cpu_count() or 1)) as executor:
+        stage_metrics = list(executor.map(_parse_stage, stage_files))
+    all_parsed = all(metrics is not None for metrics in stage_metrics)
+
+    for metrics in stage_metrics:
+        if metrics is None:
+            continue
+
+        concurrency = metrics["concurrency"]
+        x_name, x_value = ("concurrency", concurrency) if concurrency else ("qps", metrics["qps"])
+        for name in _LATENCY_SERIES + _THROUGHPUT_SERIES:
+            if metrics[name] is not None:
+                series[f"{x_name}_vs_{name}"].append((x_value, metrics[name]))
+
+        if not concurrency:
+            for name in ("goodput_percentage", "request_goodput_rate"):
+                if metrics[name] is not None:
+                    series[f"qps_vs_{name}"].append((metrics["qps"], metrics[name]))
+
+        # Populate latency vs throughput data
+        if metrics["otps"] is not None:
+            for name in _LATENCY_SERIES:
+                if metrics[name] is not None:
+                    series[f"{name}_vs_otps"].append((metrics[name], metrics["otps"]))
 
+    return series, all_parsed
 
-def _extract_throughput_metric(throughput_data: Dict[str, Any], metric_name: str) -> Optional[float]:
-    """Helper to extract a throughput metric's value."""
-    metric_value = throughput_data.get(metric_name)
-    if isinstance(metric_value, (int, float)):
-        return float(metric_value)
-    return None
+
+def _stage_signature(stage_files: List[Path]) -> List[str]:
+    """Identifies the current contents of the stage files by name, mtime and size."""
+    signature = [f"version:{_SERIES_CACHE_VERSION}"]
+    for stage_file in sorted(stage_files):
+        stat = stage_file.stat()
+        signature.append(f"{stage_file.name}:{stat.st_mtime_ns}:{stat.st_size}")
+    return signature
+
+
+def _load_cached_series(report_path: Path, signature: List[str]) -> Optional[Dict[str, List[Tuple[float, float]]]]:
+    """Returns the series cached for report_path, or None if missing or stale."""
+    try:
+        with np.load(report_path / _SERIES_CACHE_FILE, allow_pickle=False) as cached:
+            if cached[_SIGNATURE_KEY].tolist() != signature:
+                return None
+            return {name: cached[name].tolist() for name in cached.files if name != _SIGNATURE_KEY}
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def _save_cached_series(report_path: Path, signature: List[str], series: Dict[str, List[Tuple[float, float]]]) -> None:
+    """Caches the parsed series next to the stage files. Failures only skip caching."""
+    try:
+        arrays: Dict[str, Any] = {name: np.asarray(points, dtype=np.float64) for name, points in series.items() if points}
+        arrays[_SIGNATURE_KEY] = np.asarray(signature, dtype=np.str_)
+        with open(report_path / _SERIES_CACHE_FILE, "wb") as f:
+            np.savez_compressed(f, **arrays)
+    except (OSError, ValueError) as e:
+        logger.debug(f"Could not cache parsed series in {report_path}: {e}")
+
+
+def _reusable_figure(num_charts: int) -> "Figure":
+    """
+    Returns this thread's Figure, cleared and resized for num_charts subplots.
+    Figures are built with the object-oriented API instead of pyplot, so no
+    backend is bootstrapped and one Figure is reused for every chart rather
+    than created and destroyed per file.
+    """
+    from matplotlib.figure import Figure
+
+    fig: Optional[Figure] = getattr(_figures, "figure", None)
+    if fig is None:
+        fig = _figures.figure = Figure()
+    else:
+        fig.clear()
+    fig.set_size_inches(7 * num_charts, 6)
+    return fig
 
 
 def _generate_multi_plot(
     chartset_to_generate: List[List[Dict[str, Any]]], num_charts: int, names: List[str], suptitle: str, output_path: Path
 ) -> None:
     """Generates and saves a plot with multiple subplots."""
-    import matplotlib.pyplot as plt
-
     if not num_charts:
         logger.debug("No chart data available")
         return
@@ -53,7 +374,8 @@ def _generate_multi_plot(
         logger.warning(f"No data available to generate chart: {output_path.name}")
         return
 
-    fig, axes = plt.subplots(1, num_charts, figsize=(7 * num_charts, 6), squeeze=False)
+    fig = _reusable_figure(num_charts)
+    axes = fig.subplots(1, num_charts, squeeze=False)
     fig.suptitle(suptitle, fontsize=16)
 
     for charts_to_generate in chartset_to_generate:
@@ -63,10 +385,7 @@ def _generate_multi_plot(
         for i, chart_info in enumerate(charts_to_generate):
             ax = axes[0, i]
             data = chart_info["data"]
-            qps_values = [x[0] for x in data]
-            y_values = [x[1] for x in data]
-
-            ax.plot(qps_values, y_values, marker="o", linestyle="-")
+            ax.plot(data[:, 0], data[:, 1], marker="o", linestyle="-")
             ax.set_title(chart_info["title"])
             ax.set_xlabel(chart_info.get("xlabel", "QPS (requested rate)"))
             ax.set_ylabel(chart_info["ylabel"])
@@ -77,39 +396,49 @@ def _generate_multi_plot(
             ax.grid(True)
 
     fig.tight_layout(rect=(0, 0.03, 1, 0.95))
-    plt.savefig(output_path)
+    fig.savefig(output_path)
     logger.info(f"Chart saved to {output_path}")
-    plt.close(fig)
 
 
 def _generate_plot(charts_to_generate: List[Dict[str, Any]], suptitle: str, output_path: Path) -> None:
     """Generates and saves a plot with multiple subplots."""
-    import matplotlib.pyplot as plt
-
     if not charts_to_generate:
         logger.warning(f"No data available to generate chart: {output_path.name}")
         return
 
     num_charts = len(charts_to_generate)
-    fig, axes = plt.subplots(1, num_charts, figsize=(7 * num_charts, 6), squeeze=False)
+    fig = _reusable_figure(num_charts)
+    axes = fig.subplots(1, num_charts, squeeze=False)
     fig.suptitle(suptitle, fontsize=16)
 
     for i, chart_info in enumerate(charts_to_generate):
         ax = axes[0, i]
         data = chart_info["data"]
-        qps_values = [x[0] for x in data]
-        y_values = [x[1] for x in data]
-
-        ax.plot(qps_values, y_values, marker="o", linestyle="-")
+        ax.plot(data[:, 0], data[:, 1], marker="o", linestyle="-")
         ax.set_title(chart_info["title"])
         ax.set_xlabel(chart_info.get("xlabel", "QPS (requested rate)"))
         ax.set_ylabel(chart_info["ylabel"])
         ax.grid(True)
 
     fig.tight_layout(rect=(0, 0.03, 1, 0.95))
-    plt.savefig(output_path)
+    fig.savefig(output_path)
     logger.info(f"Chart saved to {output_path}")
-    plt.close(fig)
+
+
+def _run_plot_calls(plot_calls: List[Callable[[], None]]) -> None:
+    """
+    Renders the given plots on a thread pool. Every thread draws on its own
+    Figure (see _reusable_figure), and rasterizing and PNG compression release
+    the GIL, so the files are written in parallel.
+    """
+    max_workers = min(len(plot_calls), os.cpu_count() or 1)
+    if max_workers <= 1:
+        for plot_call in plot_calls:
+            plot_call()
+        return
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for future in [executor.submit(plot_call) for plot_call in plot_calls]:
+            future.result()
 
 
 def analyze_reports(report_dirs: List[str], analysis_dir: Optional[str] = None) -> None:
@@ -136,343 +465,33 @@ def analyze_reports(report_dirs: List[str], analysis_dir: Optional[str] = None)
 
         # Find stage lifecycle metrics files
         report_path = Path(report_dir)
-        stage_files = list(report_path.glob("stage_*_lifecycle_metrics.json"))
+        stage_files = _find_stage_files(report_path)
 
         if not stage_files:
             logger.error(f"No stage lifecycle metrics files found in {report_dir}")
             return
 
-        # Latency data (concurrency)
-        concurrency_vs_ttft: List[Tuple[float, float]] = []
-        concurrency_vs_ntpot: List[Tuple[float, float]] = []
-        concurrency_vs_itl: List[Tuple[float, float]] = []
-        # Throughput data (concurrency)
-        concurrency_vs_itps: List[Tuple[float, float]] = []
-        concurrency_vs_otps: List[Tuple[float, float]] = []
-        concurrency_vs_ttps: List[Tuple[float, float]] = []
-        # Latency data (QPS)
-        qps_vs_ttft: List[Tuple[float, float]] = []
-        qps_vs_ntpot: List[Tuple[float, float]] = []
-        qps_vs_itl: List[Tuple[float, float]] = []
-        # Throughput data (QPS)
-        qps_vs_itps: List[Tuple[float, float]] = []
-        qps_vs_otps: List[Tuple[float, float]] = []
-        qps_vs_ttps: List[Tuple[float, float]] = []
-        qps_vs_goodput_percentage: List[Tuple[float, float]] = []
-        qps_vs_request_goodput_rate: List[Tuple[float, float]] = []
-        # Throughput vs Latency data
-        ttft_vs_otps: List[Tuple[float, float]] = []
-        ntpot_vs_otps: List[Tuple[float, float]] = []
-        itl_vs_otps: List[Tuple[float, float]] = []
-
-        for stage_file in stage_files:
-            try:
-                with open(stage_file, "r") as f:
-                    report_data = json.load(f)
-
-                # Get concurrency
-                concurrency = report_data.get("load_summary", {}).get("concurrency", None)
-
-                # Get QPS from report file
-                qps = report_data.get("load_summary", {}).get("achieved_rate")
-                if qps is None:
-                    logger.warning(f"Could not find achieved_rate in {stage_file.name}. Skipping.")
-                    continue
-
-                success_data = report_data.get("successes", {})
-                if not success_data:
-                    logger.warning(f"No success data in {stage_file.name}. Skipping.")
-                    continue
-
-                # Extract latency metrics if they exist
-                ttft, ntpot, itl = None, None, None
-                latency_data = success_data.get("latency", {})
-                if latency_data:
-                    ttft = _extract_latency_metric(latency_data, "time_to_first_token", convert_to_ms=True)
-                    if ttft is not None:
-                        if concurrency:
-                            concurrency_vs_ttft.append((concurrency, ttft))
-                        else:
-                            qps_vs_ttft.append((qps, ttft))
-
-                    ntpot = _extract_latency_metric(latency_data, "normalized_time_per_output_token", convert_to_ms=True)
-                    if ntpot is not None:
-                        if concurrency:
-                            concurrency_vs_ntpot.append((concurrency, ntpot))
-                        else:
-                            qps_vs_ntpot.append((qps, ntpot))
-
-                    itl = _extract_latency_metric(latency_data, "inter_token_latency", convert_to_ms=True)
-                    if itl is not None:
-                        if concurrency:
-                            concurrency_vs_itl.append((concurrency, itl))
-                        else:
-                            qps_vs_itl.append((qps, itl))
-
-                # Extract throughput metrics if they exist
-                otps = None
-                throughput_data = success_data.get("throughput", {})
-                if throughput_data:
-                    itps = _extract_throughput_metric(throughput_data, "input_tokens_per_sec")
-                    if itps is not None:
-                        if concurrency:
-                            concurrency_vs_itps.append((concurrency, itps))
-                        else:
-                            qps_vs_itps.append((qps, itps))
-
-                    otps = _extract_throughput_metric(throughput_data, "output_tokens_per_sec")
-                    if otps is not None:
-                        if concurrency:
-                            concurrency_vs_otps.append((concurrency, otps))
-                        else:
-                            qps_vs_otps.append((qps, otps))
-
-                    ttps = _extract_throughput_metric(throughput_data, "total_tokens_per_sec")
-                    if ttps is not None:
-                        if concurrency:
-                            concurrency_vs_ttps.append((concurrency, ttps))
-                        else:
-                            qps_vs_ttps.append((qps, ttps))
-
-                # Extract goodput metrics if they exist
-                goodput_metrics = success_data.get("goodput_metrics", {})
-                if goodput_metrics:
-                    goodput_percentage = goodput_metrics.get("goodput_percentage")
-                    if goodput_percentage is not None:
-                        if not concurrency:
-                            qps_vs_goodput_percentage.append((qps, goodput_percentage))
-
-                    req_goodput_rate = goodput_metrics.get("request_goodput")
-                    if req_goodput_rate is None:
-                        req_goodput_rate = goodput_metrics.get("request_goodput_rate")
-                    if req_goodput_rate is not None:
-                        if not concurrency:
-                            qps_vs_request_goodput_rate.append((qps, req_goodput_rate))
-
-                # Populate latency vs throughput data
-                if otps is not None:
-                    if ttft is not None:
-                        ttft_vs_otps.append((ttft, otps))
-                    if ntpot is not None:
-                        ntpot_vs_otps.append((ntpot, otps))
-                    if itl is not None:
-                        itl_vs_otps.append((itl, otps))
-
-            except json.JSONDecodeError:
-                logger.error(f"Error decoding JSON from {stage_file.name}")
-                continue
-            except Exception as e:
-                logger.error(f"An unexpected error occurred while processing {stage_file.name}: {e}")
-                continue
-
-        # --- Generate Concurrency Latency Plot ---
-        concurrency_latency_charts_to_generate = []
-        if concurrency_vs_ttft:
-            concurrency_latency_charts_to_generate.append(
-                {
-                    "title": "Time to First Token vs. Concurrency",
-                    "xlabel": "Concurrency",
-                    "ylabel": "Mean TTFT (ms)",
-                    "data": sorted(concurrency_vs_ttft, key=operator.itemgetter(0)),
-                }
-            )
-        if concurrency_vs_ntpot:
-            concurrency_latency_charts_to_generate.append(
-                {
-                    "title": "Norm. Time per Output Token vs. Concurrency",
-                    "xlabel": "Concurrency",
-                    "ylabel": "Mean Norm. Time (ms/token)",
-                    "data": sorted(concurrency_vs_ntpot, key=operator.itemgetter(0)),
-                }
-            )
-        if concurrency_vs_itl:
-            concurrency_latency_charts_to_generate.append(
-                {
-                    "title": "Inter-Token Latency vs. Concurrency",
-                    "xlabel": "Concurrency",
-                    "ylabel": "Mean ITL (ms)",
-                    "data": sorted(concurrency_vs_itl, key=operator.itemgetter(0)),
-                }
-            )
-
-        _generate_plot(
-            concurrency_latency_charts_to_generate,
-            "Latency vs Concurrency",
-            report_path / "latency_vs_concurrency.png",
-        )
-
-        # --- Generate Concurrency Throughput Plot ---
-        concurrency_throughput_charts_to_generate = []
-        if concurrency_vs_itps:
-            concurrency_throughput_charts_to_generate.append(
-                {
-                    "title": "Input Tokens/sec vs. Concurrency",
-                    "xlabel": "Concurrency",
-                    "ylabel": "Tokens/sec",
-                    "data": sorted(concurrency_vs_itps, key=operator.itemgetter(0)),
-                }
-            )
-        if concurrency_vs_otps:
-            concurrency_throughput_charts_to_generate.append(
-                {
-                    "title": "Output Tokens/sec vs. Concurrency",
-                    "xlabel": "Concurrency",
-                    "ylabel": "Tokens/sec",
-                    "data": sorted(concurrency_vs_otps, key=operator.itemgetter(0)),
-                }
-            )
-        if concurrency_vs_ttps:
-            concurrency_throughput_charts_to_generate.append(
-                {
-                    "title": "Total Tokens/sec vs. Concurrency",
-                    "xlabel": "Concurrency",
-                    "ylabel": "Tokens/sec",
-                    "data": sorted(concurrency_vs_ttps, key=operator.itemgetter(0)),
-                }
-            )
-
-        _generate_plot(
-            concurrency_throughput_charts_to_generate,
-            "Throughput vs Concurrency",
-            report_path / "throughput_vs_concurrency.png",
-        )
-
-        # --- Generate QPS Latency Plot ---
-        latency_charts_to_generate = []
-        if qps_vs_ttft:
-            latency_charts_to_generate.append(
-                {
-                    "title": "Time to First Token vs. QPS",
-                    "ylabel": "Mean TTFT (ms)",
-                    "data": sorted(qps_vs_ttft, key=operator.itemgetter(0)),
-                }
-            )
-        if qps_vs_ntpot:
-            latency_charts_to_generate.append(
-                {
-                    "title": "Norm. Time per Output Token vs. QPS",
-                    "ylabel": "Mean Norm. Time (ms/token)",
-                    "data": sorted(qps_vs_ntpot, key=operator.itemgetter(0)),
-                }
-            )
-        if qps_vs_itl:
-            latency_charts_to_generate.append(
-                {
-                    "title": "Inter-Token Latency vs. QPS",
-                    "ylabel": "Mean ITL (ms)",
-                    "data": sorted(qps_vs_itl, key=operator.itemgetter(0)),
-                }
-            )
-
-        _generate_plot(
-            latency_charts_to_generate,
-            "Latency vs Request Rate",
-            report_path / "latency_vs_qps.png",
-        )
-
-        # --- Generate QPS Throughput Plot ---
-        throughput_charts_to_generate = []
-        if qps_vs_itps:
-            throughput_charts_to_generate.append(
-                {
-                    "title": "Input Tokens/sec vs. QPS",
-                    "ylabel": "Tokens/sec",
-                    "data": sorted(qps_vs_itps, key=operator.itemgetter(0)),
-                }
-            )
-        if qps_vs_otps:
-            throughput_charts_to_generate.append(
-                {
-                    "title": "Output Tokens/sec vs. QPS",
-                    "ylabel": "Tokens/sec",
-                    "data": sorted(qps_vs_otps, key=operator.itemgetter(0)),
-                }
-            )
-        if qps_vs_ttps:
-            throughput_charts_to_generate.append(
-                {
-                    "title": "Total Tokens/sec vs. QPS",
-                    "ylabel": "Tokens/sec",
-                    "data": sorted(qps_vs_ttps, key=operator.itemgetter(0)),
-                }
-            )
-
-        _generate_plot(
-            throughput_charts_to_generate,
-            "Throughput vs Request Rate",
-            report_path / "throughput_vs_qps.png",
-        )
-
-        # --- Generate QPS Goodput Plot ---
-        goodput_charts_to_generate = []
-        if qps_vs_goodput_percentage:
-            goodput_charts_to_generate.append(
-                {
-                    "title": "Goodput % vs. QPS",
-                    "ylabel": "Goodput (%)",
-                    "data": sorted(qps_vs_goodput_percentage, key=operator.itemgetter(0)),
-                }
-            )
-        if qps_vs_request_goodput_rate:
-            goodput_charts_to_generate.append(
-                {
-                    "title": "Request Goodput Rate vs. QPS",
-                    "ylabel": "Goodput Rate (req/s)",
-                    "data": sorted(qps_vs_request_goodput_rate, key=operator.itemgetter(0)),
-                }
-            )
-
-        if goodput_charts_to_generate:
-            _generate_plot(
-                goodput_charts_to_generate,
-                "Goodput vs Request Rate",
-                report_path / "goodput_vs_qps.png",
-            )
-
-        # --- Generate Throughput vs Latency Curve Plot ---
-        throughput_latency_charts_to_generate = []
-        if ntpot_vs_otps:
-            throughput_latency_charts_to_generate.append(
-                {
-                    "title": "Throughput vs. Norm. Time per Output Token",
-                    "xlabel": "Mean Norm. Time (ms/token)",
-                    "ylabel": "Output Tokens/sec",
-                    "data": sorted(ntpot_vs_otps, key=operator.itemgetter(0)),
-                }
-            )
-        if ttft_vs_otps:
-            throughput_latency_charts_to_generate.append(
-                {
-                    "title": "Throughput vs. Time to First Token",
-                    "xlabel": "Mean TTFT (ms)",
-                    "ylabel": "Output Tokens/sec",
-                    "data": sorted(ttft_vs_otps, key=operator.itemgetter(0)),
-                }
-            )
-        if itl_vs_otps:
-            throughput_latency_charts_to_generate.append(
-                {
-                    "title": "Throughput vs. Inter-Token Latency",
-                    "xlabel": "Mean ITL (ms)",
-                    "ylabel": "Output Tokens/sec",
-                    "data": sorted(itl_vs_otps, key=operator.itemgetter(0)),
-                }
-            )
-
-        _generate_plot(
-            throughput_latency_charts_to_generate,
-            "Latency vs Throughput",
-            report_path / "throughput_vs_latency.png",
-        )
-
-        chartset[report_path] = [
-            concurrency_latency_charts_to_generate,
-            concurrency_throughput_charts_to_generate,
-            latency_charts_to_generate,
-            throughput_charts_to_generate,
-            throughput_latency_charts_to_generate,
-            goodput_charts_to_generate,
-        ]
+        # Reuse the series parsed by a previous run if no stage file changed.
+        signature = _stage_signature(stage_files)
+        series = _load_cached_series(report_path, signature)
+        if series is None:
+            series, all_parsed = _collect_series(stage_files)
+            # Don't cache a failed read or parse, the next run retries it.
+            if all_parsed:
+                _save_cached_series(report_path, signature, series)
+
+        report_charts = []
+        plot_calls: List[Callable[[], None]] = []
+        for suptitle, filename, skip_if_empty, chart_specs in _PLOTS:
+            charts_to_generate = [
+                {**chart_spec, "data": _sorted_series(series[name])} for name, chart_spec in chart_specs if series.get(name)
+            ]
+            if charts_to_generate or not skip_if_empty:
+                plot_calls.append(partial(_generate_plot, charts_to_generate, suptitle, report_path / filename))
+            report_charts.append(charts_to_generate)
+        _run_plot_calls(plot_calls)
+
+        chartset[report_path] = report_charts
 
     if analysis_dir:
         logger.info(f"Unified analysis reporting in {analysis_dir}")
@@ -484,70 +503,18 @@ def analyze_reports(report_dirs: List[str], analysis_dir: Optional[str] = None)
         with open(analysis_path / "analyzed_reports_legend.json", "w") as f:
             json.dump(report_legend_dict, f, indent=2)
 
-        # --- Generate Concurrency Latency Plot ---
-        setof_concurrency_latency_charts_to_generate = [charts_to_generate[0] for charts_to_generate in chartset.values()]
-        if len(setof_concurrency_latency_charts_to_generate) > 0:
-            _generate_multi_plot(
-                setof_concurrency_latency_charts_to_generate,
-                len(max(setof_concurrency_latency_charts_to_generate, key=len)),
-                report_names,
-                "Latency vs Concurrency",
-                analysis_path / "latency_vs_concurrency.png",
-            )
-
-        # --- Generate Concurrency Throughput Plot ---
-        setof_concurrency_throughput_charts_to_generate = [charts_to_generate[1] for charts_to_generate in chartset.values()]
-        if len(setof_concurrency_throughput_charts_to_generate) > 0:
-            _generate_multi_plot(
-                setof_concurrency_throughput_charts_to_generate,
-                len(max(setof_concurrency_throughput_charts_to_generate, key=len)),
-                report_names,
-                "Throughput vs Concurrency",
-                analysis_path / "throughput_vs_concurrency.png",
-            )
-
-        # --- Generate QPS Latency Plot ---
-        setof_latency_charts_to_generate = [charts_to_generate[2] for charts_to_generate in chartset.values()]
-        if len(setof_latency_charts_to_generate) > 0:
-            _generate_multi_plot(
-                setof_latency_charts_to_generate,
-                len(max(setof_latency_charts_to_generate, key=len)),
-                report_names,
-                "Latency vs Request Rate",
-                analysis_path / "latency_vs_qps.png",
-            )
-
-        # --- Generate QPS Throughput Plot ---
-        setof_throughput_charts_to_generate = [charts_to_generate[3] for charts_to_generate in chartset.values()]
-        if len(setof_throughput_charts_to_generate) > 0:
-            _generate_multi_plot(
-                setof_throughput_charts_to_generate,
-                len(max(setof_throughput_charts_to_generate, key=len)),
-                report_names,
-                "Throughput vs Request Rate",
-                analysis_path / "throughput_vs_qps.png",
-            )
-
-        # --- Generate Throughput vs Latency Curve Plot ---
-        setof_throughput_latency_charts_to_generate = [charts_to_generate[4] for charts_to_generate in chartset.values()]
-        if len(setof_throughput_latency_charts_to_generate) > 0:
-            _generate_multi_plot(
-                setof_throughput_latency_charts_to_generate,
-                len(max(setof_throughput_latency_charts_to_generate, key=len)),
-                report_names,
-                "Latency vs Throughput",
-                analysis_path / "throughput_vs_latency.png",
-            )
-
-        # --- Generate QPS Goodput Plot (Unified) ---
-        setof_goodput_charts_to_generate = [
-            charts_to_generate[5] for charts_to_generate in chartset.values() if len(charts_to_generate) > 5
-        ]
-        if len(setof_goodput_charts_to_generate) > 0:
-            _generate_multi_plot(
-                setof_goodput_charts_to_generate,
-                len(max(setof_goodput_charts_to_generate, key=len)),
-                report_names,
-                "Goodput vs Request Rate",
-                analysis_path / "goodput_vs_qps.png",
-            )
+        # Transpose once so each plot holds the chart lists of every report.
+        charts_by_plot = list(zip(*chartset.values(), strict=True)) if chartset else []
+        _run_plot_calls(
+            [
+                partial(
+                    _generate_multi_plot,
+                    list(setof_charts_to_generate),
+                    max(len(charts_to_generate) for charts_to_generate in setof_charts_to_generate),
+                    report_names,
+                    suptitle,
+                    analysis_path / filename,
+                )
+                for setof_charts_to_generate, (suptitle, filename, _, _) in zip(charts_by_plot, _PLOTS, strict=False)
+            ]
+        )
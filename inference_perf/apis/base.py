@@ -15,7 +15,7 @@
 from abc import abstractmethod
 from typing import Any, List, Optional, Union
 from aiohttp import ClientResponse
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from inference_perf.utils.custom_tokenizer import CustomTokenizer
 from inference_perf.config import APIConfig, APIType
 
@@ -25,16 +25,16 @@ class UnaryInferenceResponseInfo(BaseModel):
 
 
 class StreamedInferenceResponseInfo(BaseModel):
-    response_chunks: List[str] = []
-    chunk_times: List[float] = []
+    response_chunks: List[str] = Field(default_factory=list)
+    chunk_times: List[float] = Field(default_factory=list)
     output_tokens: int = 0
-    output_token_times: List[float] = []
+    output_token_times: List[float] = Field(default_factory=list)
     server_usage: Optional[dict[str, Any]] = None
 
 
 class InferenceInfo(BaseModel):
     input_tokens: int = 0
-    extra_info: dict[str, Any] = {}
+    extra_info: dict[str, Any] = Field(default_factory=dict)
     lora_adapter: Optional[str] = None
     response_info: Optional[Union[UnaryInferenceResponseInfo, StreamedInferenceResponseInfo]] = None
 
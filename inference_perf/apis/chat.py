@@ -12,9 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Tuple
 from aiohttp import ClientResponse
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 from inference_perf.apis import InferenceAPIData, InferenceInfo, UnaryInferenceResponseInfo, StreamedInferenceResponseInfo
 from inference_perf.utils.custom_tokenizer import CustomTokenizer
 from inference_perf.config import APIConfig, APIType
@@ -30,6 +30,11 @@ class ChatCompletionAPIData(InferenceAPIData):
     messages: List[ChatMessage]
     max_tokens: int = 0
 
+    # messages in payload form, paired with the list they were built from
+    _messages_payload: Optional[Tuple[List[ChatMessage], List[dict[str, str]]]] = PrivateAttr(default=None)
+    # prompt token count, paired with the list it was counted from
+    _prompt_len: Optional[Tuple[List[ChatMessage], int]] = PrivateAttr(default=None)
+
     def get_api_type(self) -> APIType:
         return APIType.Chat
 
@@ -43,13 +48,27 @@ class ChatCompletionAPIData(InferenceAPIData):
             self.max_tokens = max_tokens
         return {
             "model": effective_model_name,
-            "messages": [{"role": m.role, "content": m.content} for m in self.messages],
+            "messages": self._get_messages_payload(),
             "max_tokens": self.max_tokens,
             "ignore_eos": ignore_eos,
             "stream": streaming,
             **({"stream_options": {"include_usage": True}} if streaming else {}),
         }
 
+    def _get_messages_payload(self) -> List[dict[str, str]]:
+        """Builds the payload messages once, rebuilding only if messages is reassigned."""
+        if self._messages_payload is None or self._messages_payload[0] is not self.messages:
+            payload = [{"role": m.role, "content": m.content} for m in self.messages]
+            self._messages_payload = (self.messages, payload)
+        return self._messages_payload[1]
+
+    def _count_prompt_tokens(self, tokenizer: CustomTokenizer) -> int:
+        """Counts the prompt tokens once, recounting only if messages is reassigned."""
+        if self._prompt_len is None or self._prompt_len[0] is not self.messages:
+            prompt_len = sum(tokenizer.count_tokens_batch([msg.content for msg in self.messages if msg.content]))
+            self._prompt_len = (self.messages, prompt_len)
+        return self._prompt_len[1]
+
     async def process_response(
         self, response: ClientResponse, config: APIConfig, tokenizer: CustomTokenizer, lora_adapter: Optional[str] = None
     ) -> InferenceInfo:
@@ -59,7 +78,7 @@ class ChatCompletionAPIData(InferenceAPIData):
                 response, extract_content=lambda data: data.get("choices", [{}])[0].get("delta", {}).get("content")
             )
 
-            prompt_len = sum(tokenizer.count_tokens(msg.content) for msg in self.messages if msg.content)
+            prompt_len = self._count_prompt_tokens(tokenizer)
             output_len = tokenizer.count_tokens(output_text)
             return InferenceInfo(
                 input_tokens=prompt_len,
@@ -75,7 +94,7 @@ class ChatCompletionAPIData(InferenceAPIData):
             )
         else:
             data = await response.json()
-            prompt_len = sum(tokenizer.count_tokens(msg.content) for msg in self.messages if msg.content)
+            prompt_len = self._count_prompt_tokens(tokenizer)
             choices = data.get("choices", [])
             if len(choices) == 0:
                 return InferenceInfo(input_tokens=prompt_len, lora_adapter=lora_adapter)
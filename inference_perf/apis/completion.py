@@ -13,9 +13,10 @@
 # limitations under the License.
 
 
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 
 from aiohttp import ClientResponse
+from pydantic import PrivateAttr
 from inference_perf.apis import InferenceAPIData, InferenceInfo, UnaryInferenceResponseInfo, StreamedInferenceResponseInfo
 from inference_perf.utils.custom_tokenizer import CustomTokenizer
 from inference_perf.config import APIConfig, APIType
@@ -27,6 +28,8 @@ class CompletionAPIData(InferenceAPIData):
     max_tokens: int = 0
     model_response: str = ""
 
+    _prompt_len: Optional[Tuple[str, int]] = PrivateAttr(default=None)
+
     def get_api_type(self) -> APIType:
         return APIType.Completion
 
@@ -47,6 +50,12 @@ class CompletionAPIData(InferenceAPIData):
             **({"stream_options": {"include_usage": True}} if streaming else {}),
         }
 
+    def _count_prompt_tokens(self, tokenizer: CustomTokenizer) -> int:
+        """Counts the prompt tokens once, recounting only if prompt is reassigned."""
+        if self._prompt_len is None or self._prompt_len[0] is not self.prompt:
+            self._prompt_len = (self.prompt, tokenizer.count_tokens(self.prompt))
+        return self._prompt_len[1]
+
     async def process_response(
         self, response: ClientResponse, config: APIConfig, tokenizer: CustomTokenizer, lora_adapter: Optional[str] = None
     ) -> InferenceInfo:
@@ -56,7 +65,7 @@ class CompletionAPIData(InferenceAPIData):
                 response, extract_content=lambda data: data.get("choices", [{}])[0].get("text")
             )
 
-            prompt_len = tokenizer.count_tokens(self.prompt)
+            prompt_len = self._count_prompt_tokens(tokenizer)
             output_len = tokenizer.count_tokens(output_text)
             return InferenceInfo(
                 input_tokens=prompt_len,
@@ -72,7 +81,7 @@ class CompletionAPIData(InferenceAPIData):
             )
         else:
             data = await response.json()
-            prompt_len = tokenizer.count_tokens(self.prompt)
+            prompt_len = self._count_prompt_tokens(tokenizer)
             choices = data.get("choices", [])
             if len(choices) == 0:
                 return InferenceInfo(input_tokens=prompt_len, lora_adapter=lora_adapter)
@@ -25,6 +25,8 @@ from typing import Any, Callable, List, Optional, Tuple
 
 from aiohttp import ClientResponse
 
+from inference_perf.utils import fast_json
+
 
 async def parse_sse_stream(
     response: ClientResponse, extract_content: Callable[[dict[str, Any]], Optional[str]]
@@ -48,7 +50,8 @@ async def parse_sse_stream(
         - output_text: The concatenated text content from all chunks
         - chunk_times: Timestamps for content-bearing chunks only. Role-only
           deltas, usage-only chunks, [DONE] signals, and unparseable messages
-          are excluded so they don't corrupt downstream TPOT/TTFT/ITL.
+          are excluded so they don't corrupt downstream TPOT/TTFT/ITL. Each
+          time is taken when the network chunk completing the event arrived.
         - raw_content: The raw string content of the stream
         - response_chunks: Raw JSON strings of content-bearing chunks, 1:1 with
           chunk_times.
@@ -56,37 +59,55 @@ async def parse_sse_stream(
           (e.g. trailing `{"choices":[],"usage":{...}}` when stream_options
           include_usage=true). None if the server didn't emit usage.
     """
-    output_text = ""
+    output_parts: List[str] = []
     chunk_times: List[float] = []
-    buffer = b""
-    raw_content = b""
+    raw_content = bytearray()
     response_chunks: List[str] = []
     server_usage: Optional[dict[str, Any]] = None
 
+    # Complete lines are consumed from the buffer as they arrive; scan_pos marks
+    # the start of the first unconsumed line, and event_data collects the
+    # payloads of the data lines seen since the last blank line.
+    buffer = bytearray()
+    scan_pos = 0
+    event_data: List[bytes] = []
+    done = False
+
     async for chunk in response.content.iter_any():
-        raw_content += chunk
-        buffer += chunk
-        while b"\n\n" in buffer:
-            message, buffer = buffer.split(b"\n\n", 1)
-            message_time = time.perf_counter()
-            done = False
-            for line in message.split(sep=b"\n"):
-                if line.startswith(b"data:"):
-                    data_str = line.removeprefix(b"data: ").strip()
-                    if data_str == b"[DONE]":
-                        done = True
-                        break
-                    try:
-                        data = json.loads(data_str)
-                        if usage := data.get("usage"):
-                            server_usage = usage
-                        if content := extract_content(data):
-                            output_text += content
-                            chunk_times.append(message_time)
-                            response_chunks.append(data_str.decode("utf-8", errors="ignore"))
-                    except (json.JSONDecodeError, IndexError):
-                        continue
+        raw_content.extend(chunk)
+        if done:
+            # Nothing after [DONE] is parsed, but the stream is still drained.
+            continue
+        # Events completed by this chunk arrived together, so one timestamp serves them all.
+        chunk_time = time.perf_counter()
+        buffer.extend(chunk)
+        while (newline := buffer.find(b"\n", scan_pos)) != -1:
+            line_start, scan_pos = scan_pos, newline + 1
+            line_end = newline - 1 if newline > line_start and buffer[newline - 1] == 0x0D else newline
+            if line_end != line_start:
+                if buffer.startswith(b"data:", line_start, line_end):
+                    event_data.append(bytes(buffer[line_start + 5 : line_end]).strip())
+                continue
+
+            # A blank line dispatches the event.
+            for data_str in event_data:
+                if data_str == b"[DONE]":
+                    done = True
+                    break
+                try:
+                    data = fast_json.loads(data_str)
+                    if usage := data.get("usage"):
+                        server_usage = usage
+                    if content := extract_content(data):
+                        output_parts.append(content)
+                        chunk_times.append(chunk_time)
+                        response_chunks.append(data_str.decode("utf-8", errors="ignore"))
+                except (json.JSONDecodeError, IndexError):
+                    continue
+            event_data.clear()
             if done:
                 break
+        del buffer[:scan_pos]
+        scan_pos = 0
 
-    return output_text, chunk_times, raw_content.decode("utf-8", errors="ignore"), response_chunks, server_usage
+    return "".join(output_parts), chunk_times, raw_content.decode("utf-8", errors="ignore"), response_chunks, server_usage
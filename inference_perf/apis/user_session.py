@@ -25,6 +25,8 @@ logger = logging.getLogger(__name__)
 
 
 class LocalUserSession:
+    __slots__ = ("user_session_id", "context", "_current_round", "_in_flight")
+
     user_session_id: str
     context: str
 
@@ -34,8 +36,9 @@ class LocalUserSession:
         self.user_session_id = user_session_id
         self.context = context if context else ""
         self._current_round = 0
+        # Rounds of a session run one at a time; asyncio.Lock wakes its waiters
+        # in FIFO order, so rounds are served in the order they asked.
         self._in_flight: Optional[asyncio.Lock] = None
-        self._waiting_rounds: Optional[asyncio.Queue[asyncio.Future[bool]]] = None
 
     @classmethod
     def get_instance(cls, user_session_id: str) -> "LocalUserSession":
@@ -47,43 +50,26 @@ class LocalUserSession:
     def clear_instances(cls) -> None:
         cls._instances.clear()
 
-    def _ensure_initialized(self) -> None:
+    def _ensure_initialized(self) -> asyncio.Lock:
         if self._in_flight is None:
             self._in_flight = asyncio.Lock()
-        if self._waiting_rounds is None:
-            self._waiting_rounds = asyncio.Queue()
+        return self._in_flight
 
     async def get_context(self, round: int) -> str:
-        self._ensure_initialized()
-        assert self._waiting_rounds is not None
-        assert self._in_flight is not None
-
-        if not self._waiting_rounds.empty() or self._in_flight.locked():
-            # entering waiting queue
-            future: asyncio.Future[bool] = asyncio.Future()
-            self._waiting_rounds.put_nowait(future)
-            await future
-        await self._in_flight.acquire()
+        await self._ensure_initialized().acquire()
         self._current_round += 1
         return self.context
 
     def update_context(self, response: str) -> None:
         self.context = response
 
-        self._ensure_initialized()
-        assert self._waiting_rounds is not None
-        assert self._in_flight is not None
-
-        if not self._waiting_rounds.empty():
-            future = self._waiting_rounds.get_nowait()
-            future.set_result(True)
-
+        in_flight = self._ensure_initialized()
         # Release defensively: failure paths can call update_context after the
         # success path already released (e.g. process_response raises post-release,
         # then process_failure runs), so calling release() unconditionally raises
         # RuntimeError("Lock is not acquired."). Skip if already released.
-        if self._in_flight.locked():
-            self._in_flight.release()
+        if in_flight.locked():
+            in_flight.release()
 
 
 class UserSessionCompletionAPIData(CompletionAPIData):
@@ -11,15 +11,59 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import jmespath
+import time
 
-from datetime import datetime
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
 from pydantic import BaseModel
 from .base import CircuitBreaker
 from .config import CircuitBreakerConfig
 from .triggers import HitSample
 
+if TYPE_CHECKING:
+    from jmespath.parser import ParsedResult
+
+
+# Nodes whose first child is evaluated against the current document and the
+# rest against its result, e.g. `a.b`, `a[0]`, `a[*].b`, `a[?x].y`, `a | b`.
+_LEFT_APPLIED_NODES = {"subexpression", "index_expression", "projection", "value_projection", "filter_projection", "pipe"}
+# Nodes whose children are all evaluated against the current document.
+_COMBINING_NODES = {
+    "comparator",
+    "and_expression",
+    "or_expression",
+    "not_expression",
+    "flatten",
+    "function_expression",
+    "multi_select_list",
+    "multi_select_dict",
+    "key_val_pair",
+}
+
+
+def _root_fields(node: Dict[str, Any]) -> Optional[Set[str]]:
+    """
+    Returns the top-level fields a parsed JMESPath expression reads from the
+    document it is searched against, or None if it may need the whole document
+    (e.g. it references `@`).
+    """
+    node_type = node["type"]
+    if node_type == "field":
+        return {node["value"]}
+    if node_type in ("literal", "expref"):
+        # an expref (`&b`) is only ever evaluated against elements of an argument.
+        return set()
+    if node_type in _LEFT_APPLIED_NODES:
+        return _root_fields(node["children"][0])
+    if node_type in _COMBINING_NODES:
+        fields: Set[str] = set()
+        for child in node["children"]:
+            child_fields = _root_fields(child)
+            if child_fields is None:
+                return None
+            fields |= child_fields
+        return fields
+    return None
+
 
 class SimpleCircuitBreaker(CircuitBreaker):
     """
@@ -30,10 +74,22 @@ class SimpleCircuitBreaker(CircuitBreaker):
 
     def __init__(self, config: CircuitBreakerConfig) -> None:
         super().__init__(config)
+        # Imported here so runs without circuit breakers never load jmespath.
+        import jmespath
+
         self._matches = [jmespath.compile(expr) for expr in config.metrics.matches]
         self._rules = [jmespath.compile(expr) for expr in config.metrics.rules]
 
-    def _search(self, exprs: List[jmespath.parser.ParsedResult], data: Dict[str, Any]) -> bool:
+        # Only the fields the expressions read are serialized on each feed.
+        self._fields: Optional[Set[str]] = set()
+        for expr in self._matches + self._rules:
+            expr_fields = _root_fields(expr.parsed)
+            if expr_fields is None:
+                self._fields = None
+                break
+            self._fields |= expr_fields
+
+    def _search(self, exprs: List["ParsedResult"], data: Dict[str, Any]) -> bool:
         for expr in exprs:
             try:
                 if bool(expr.search(data)):
@@ -43,10 +99,10 @@ class SimpleCircuitBreaker(CircuitBreaker):
         return False
 
     def feed(self, metric: BaseModel) -> None:
-        data = metric.model_dump(mode="json", exclude_unset=True, exclude_none=True)
+        data = metric.model_dump(mode="json", include=self._fields, exclude_unset=True, exclude_none=True)
         if self._search(self._matches, data):
             hit = 1 if not self._rules or self._search(self._rules, data) else 0
-            hit_sample = HitSample(datetime.now(), hit)
+            hit_sample = HitSample(time.monotonic(), hit)
             for t in self._triggers:
                 t.update(hit_sample)
                 if t.fired():
@@ -14,12 +14,6 @@
 from .base import build_trigger, Trigger, HitSample
 from .config import TriggerSpec
 
-from pkgutil import walk_packages
-from importlib import import_module
-
-for module_info in walk_packages(__path__):
-    import_module(f"{__name__}.{module_info.name}")
-
 __all__ = [
     "build_trigger",
     "HitSample",
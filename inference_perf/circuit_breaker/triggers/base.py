@@ -14,8 +14,9 @@
 from __future__ import annotations
 from abc import ABCMeta, abstractmethod
 from dataclasses import dataclass
+from importlib import import_module
+from pkgutil import walk_packages
 from typing import Type, Any, Optional, Dict, Tuple
-from datetime import datetime
 from .config import TriggerSpec
 
 trigger_implementations: dict[Type[TriggerSpec], type] = {}
@@ -39,9 +40,10 @@ class TriggerMeta(ABCMeta):
         return cls
 
 
-@dataclass
+@dataclass(slots=True)
 class HitSample:
-    ts: datetime
+    # Seconds from time.monotonic().
+    ts: float
     hit: int
 
 
@@ -60,7 +62,17 @@ def _init_trigger(trigger_class: type[Trigger], type: str, **kargs: Any) -> Trig
     return trigger_class(**kargs)
 
 
+def _load_trigger_implementations() -> None:
+    """Imports every trigger module so its classes register their spec."""
+    package = __name__.rpartition(".")[0]
+    for module_info in walk_packages(import_module(package).__path__):
+        import_module(f"{package}.{module_info.name}")
+
+
 def build_trigger(spec: TriggerSpec) -> Trigger:
+    # Trigger modules are only imported once a breaker is configured.
+    if type(spec) not in trigger_implementations:
+        _load_trigger_implementations()
     if type(spec) in trigger_implementations:
         return _init_trigger(trigger_implementations[type(spec)], **spec.model_dump())
     raise ValueError(f"Unknown trigger spec: {spec}")
@@ -13,7 +13,6 @@
 # limitations under the License.
 from __future__ import annotations
 import collections
-import datetime
 from typing import Deque
 from .base import Trigger, HitSample
 from .config import TriggerRateOverWindow
@@ -23,22 +22,23 @@ class RateOverWindow(Trigger, spec_cls=TriggerRateOverWindow):
     """Open when hit rate over a time window crosses threshold."""
 
     def __init__(self, window_sec: float, threshold: float, min_samples: int = 0):
-        self.size = datetime.timedelta(seconds=window_sec)
+        self.size = window_sec
         self.th = threshold
         self.min = min_samples
         self.buf: Deque[HitSample] = collections.deque()
+        # Running sum of the hits in buf.
+        self._hits = 0
         self._fired = False
 
     def update(self, s: HitSample) -> None:
-        now = s.ts
         self.buf.append(s)
-        cutoff = now - self.size
+        self._hits += s.hit
+        cutoff = s.ts - self.size
         while self.buf and self.buf[0].ts < cutoff:
-            self.buf.popleft()
+            self._hits -= self.buf.popleft().hit
         total = len(self.buf)
         if total >= self.min:
-            hits = sum(x.hit for x in self.buf)
-            rate = hits / total if total else 0.0
+            rate = self._hits / total if total else 0.0
             if rate >= self.th:
                 self._fired = True
 
@@ -47,4 +47,5 @@ class RateOverWindow(Trigger, spec_cls=TriggerRateOverWindow):
 
     def reset(self) -> None:
         self.buf.clear()
+        self._hits = 0
         self._fired = False
@@ -11,10 +11,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import json
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List
 import google.cloud.storage as storage
+from google.api_core.exceptions import PreconditionFailed
 from google.cloud.exceptions import GoogleCloudError
 from inference_perf.client.filestorage import StorageClient
 from inference_perf.config import GoogleCloudStorageConfig
@@ -28,6 +29,7 @@ class GoogleCloudStorageClient(StorageClient):
         super().__init__(config=config)
         logger.debug("Created new GCS client")
         self.output_bucket = config.bucket_name
+        self.max_workers = config.max_workers
         self.client = storage.Client()
 
         self.bucket = self.client.lookup_bucket(config.bucket_name)
@@ -39,17 +41,26 @@ class GoogleCloudStorageClient(StorageClient):
         if len(filenames) != len(set(filenames)):
             raise ValueError("Duplicate filenames detected", filenames)
 
-        for _, report in enumerate(reports):
-            filename = report.get_filename()
-            blob_path = f"{self.config.path if self.config.path else ''}/{self.config.report_file_prefix if self.config.report_file_prefix else ''}{filename}"
-            blob = self.bucket.blob(blob_path)
+        if not reports:
+            return
 
-            if blob.exists():
-                logger.info(f"Skipping upload: gs://{self.output_bucket}/{blob_path} already exists")
-                continue
+        prefix = f"{self.config.path or ''}/{self.config.report_file_prefix or ''}"
+        # Each upload is a blocking round trip, so overlap them. The storage
+        # client is safe to share across threads.
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(reports))) as pool:
+            futures = [pool.submit(self._upload_report, prefix + report.get_filename(), report) for report in reports]
+            for future in as_completed(futures):
+                future.result()
 
-            try:
-                blob.upload_from_string(json.dumps(report.get_contents()), content_type="application/json")
-                logger.info(f"Uploaded gs://{self.output_bucket}/{blob_path}")
-            except GoogleCloudError as e:
-                logger.error(f"Failed to upload {blob_path}: {e}")
+    def _upload_report(self, blob_path: str, report: ReportFile) -> None:
+        try:
+            # Generation 0 means the object must not exist yet, so an existing
+            # report is kept without a separate existence check.
+            self.bucket.blob(blob_path).upload_from_string(
+                report.get_json(indent=self.config.pretty), content_type="application/json", if_generation_match=0
+            )
+            logger.info(f"Uploaded gs://{self.output_bucket}/{blob_path}")
+        except PreconditionFailed:
+            logger.info(f"Skipping upload: gs://{self.output_bucket}/{blob_path} already exists")
+        except GoogleCloudError as e:
+            logger.error(f"Failed to upload {blob_path}: {e}")
@@ -13,16 +13,18 @@
 # limitations under the License.
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List
 from inference_perf.client.filestorage import StorageClient
 from inference_perf.config import StorageConfigBase
 from inference_perf.utils import ReportFile
-import json
 import os
 import yaml
 
 logger = logging.getLogger(__name__)
 
+LOCAL_STORAGE_MAX_WORKERS = 8
+
 
 class LocalStorageClient(StorageClient):
     def __init__(self, config: StorageConfigBase) -> None:
@@ -30,13 +32,29 @@ class LocalStorageClient(StorageClient):
         logger.info(f"Report files will be stored at: {self.config.path}")
 
     def save_report(self, reports: List[ReportFile]) -> None:
-        for report in reports:
-            filename = report.get_filename()
-            report_path = f"{self.config.path if self.config.path else ''}/{self.config.report_file_prefix if self.config.report_file_prefix else ''}{filename}"
-            os.makedirs(os.path.dirname(report_path), exist_ok=True)
+        if not reports:
+            return
+
+        prefix = f"{self.config.path or ''}/{self.config.report_file_prefix or ''}"
+        report_paths = [prefix + report.get_filename() for report in reports]
+        # Report names may contain a slash (e.g. adapter names), so there can be
+        # more than one parent directory.
+        for report_dir in {os.path.dirname(report_path) for report_path in report_paths}:
+            os.makedirs(report_dir, exist_ok=True)
+
+        # File writes release the GIL, which matters on slow or network filesystems.
+        with ThreadPoolExecutor(max_workers=min(LOCAL_STORAGE_MAX_WORKERS, len(reports))) as pool:
+            futures = [
+                pool.submit(self._write_report, path, report) for path, report in zip(report_paths, reports, strict=True)
+            ]
+            for future in as_completed(futures):
+                future.result()
+
+    def _write_report(self, report_path: str, report: ReportFile) -> None:
+        if report.file_type == "yaml":
             with open(report_path, "w", encoding="utf-8") as f:
-                if report.file_type == "yaml":
-                    yaml.dump(report.get_contents(), f, sort_keys=False, default_flow_style=False)
-                else:
-                    f.write(json.dumps(report.get_contents(), indent=2))
-            logger.info(f"Report saved to: {report_path}")
+                yaml.dump(report.get_contents(), f, sort_keys=False, default_flow_style=False)
+        else:
+            with open(report_path, "wb") as f:
+                f.write(report.get_json(indent=self.config.pretty))
+        logger.info(f"Report saved to: {report_path}")
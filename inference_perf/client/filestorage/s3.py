@@ -11,11 +11,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import json
 import logging
-from typing import Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
 import boto3
 from botocore.config import Config as BotoConfig
+from botocore.exceptions import ClientError
 from inference_perf.client.filestorage import StorageClient
 from inference_perf.config import SimpleStorageServiceConfig
 from inference_perf.utils import ReportFile
@@ -23,17 +24,28 @@ from inference_perf.utils import ReportFile
 logger = logging.getLogger(__name__)
 
 
-def _build_boto_config(addressing_style: Optional[str]) -> Optional[BotoConfig]:
+def _build_boto_config(addressing_style: Optional[str], max_pool_connections: int) -> BotoConfig:
     """Build a botocore Config that honors the configured S3 addressing style.
 
     Some S3-compatible object stores only accept virtual-hosted style requests
     (`bucket.host/key`) and reject path-style (`host/bucket/key`) with a
     `PathStyleRequestNotAllowed` error. Exposing this knob lets users target
     those backends without relying on environment-specific AWS config files.
+
+    The connection pool is sized to the number of concurrent uploads, and
+    throttled or failed requests are retried with client-side rate limiting
+    so that many uploads in flight back off instead of failing.
     """
+    retries: Dict[str, Any] = {"mode": "adaptive", "max_attempts": 10}
     if addressing_style is None:
-        return None
-    return BotoConfig(s3={"addressing_style": addressing_style})
+        return BotoConfig(max_pool_connections=max_pool_connections, retries=retries)
+    return BotoConfig(max_pool_connections=max_pool_connections, retries=retries, s3={"addressing_style": addressing_style})
+
+
+def _is_not_implemented(error: ClientError) -> bool:
+    code: Optional[str] = error.response.get("Error", {}).get("Code")
+    status: Optional[int] = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+    return code == "NotImplemented" or status == 501
 
 
 class SimpleStorageServiceClient(StorageClient):
@@ -41,42 +53,70 @@ class SimpleStorageServiceClient(StorageClient):
         super().__init__(config=config)
         logger.debug("Created new S3 client")
         self.output_bucket = config.bucket_name
+        self.max_workers = config.max_workers
         client_kwargs: dict[str, Any] = {}
         if config.endpoint_url is not None:
             client_kwargs["endpoint_url"] = config.endpoint_url
         if config.region_name is not None:
             client_kwargs["region_name"] = config.region_name
-        boto_config = _build_boto_config(config.addressing_style)
-        if boto_config is not None:
-            client_kwargs["config"] = boto_config
+        client_kwargs["config"] = _build_boto_config(config.addressing_style, config.max_workers)
         self.client = boto3.client("s3", **client_kwargs)
+        # S3-compatible stores may reject If-None-Match, or silently ignore it
+        # and overwrite existing reports. Only rely on it against AWS itself;
+        # other endpoints check for an existing report before each upload.
+        self.conditional_put = config.endpoint_url is None
 
     def save_report(self, reports: List[ReportFile]) -> None:
         filenames = [report.get_filename() for report in reports]
         if len(filenames) != len(set(filenames)):
             raise ValueError("Duplicate filenames detected", filenames)
 
-        for _, report in enumerate(reports):
-            filename = report.get_filename()
-            blob_path = f"{self.config.path if self.config.path else ''}/{self.config.report_file_prefix if self.config.report_file_prefix else ''}{filename}".lstrip(
-                "/"
-            )  # remove any leading slahes
-            try:
+        if not reports:
+            return
+
+        prefix = f"{self.config.path or ''}/{self.config.report_file_prefix or ''}".lstrip("/")  # remove any leading slahes
+        # boto3 clients are thread-safe, so the uploads share this one.
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(reports))) as pool:
+            futures = [pool.submit(self._upload_report, prefix + report.get_filename(), report) for report in reports]
+            for future in as_completed(futures):
+                future.result()
+
+    def _upload_report(self, blob_path: str, report: ReportFile) -> None:
+        try:
+            if self.conditional_put:
                 try:
-                    self.client.head_object(Bucket=self.output_bucket, Key=blob_path)
-                    logger.info(f"Skipping upload: s3://{self.output_bucket}/{blob_path} already exists")
-                    continue
+                    # If-None-Match makes S3 refuse to overwrite an existing
+                    # object, so no separate existence check is needed.
+                    self._put_report(blob_path, report, IfNoneMatch="*")
+                    return
                 except self.client.exceptions.ClientError as e:
-                    if e.response["Error"]["Code"] == "404":
-                        pass
+                    # 412 if the object exists, 409 if a concurrent write to it won
+                    if e.response["Error"]["Code"] in ("PreconditionFailed", "ConditionalRequestConflict"):
+                        logger.info(f"Skipping upload: s3://{self.output_bucket}/{blob_path} already exists")
+                        return
+                    if not _is_not_implemented(e):
+                        raise
+                    logger.warning(
+                        f"s3://{self.output_bucket} does not support conditional writes, checking for existing reports instead"
+                    )
+                    self.conditional_put = False
+
+            try:
+                self.client.head_object(Bucket=self.output_bucket, Key=blob_path)
+                logger.info(f"Skipping upload: s3://{self.output_bucket}/{blob_path} already exists")
+                return
+            except self.client.exceptions.ClientError:
+                pass
+            self._put_report(blob_path, report)
+        except Exception as e:
+            logger.error(f"Failed to upload {blob_path}: {e}")
 
-                # Upload the files
-                self.client.put_object(
-                    Bucket=self.output_bucket,
-                    Key=blob_path,
-                    Body=json.dumps(report.get_contents()),
-                    ContentType="application/json",
-                )
-                logger.info(f"Uploaded s3://{self.output_bucket}/{blob_path}")
-            except Exception as e:
-                logger.error(f"Failed to upload {blob_path}: {e}")
+    def _put_report(self, blob_path: str, report: ReportFile, **kwargs: str) -> None:
+        self.client.put_object(
+            Bucket=self.output_bucket,
+            Key=blob_path,
+            Body=report.get_json(indent=self.config.pretty),
+            ContentType="application/json",
+            **kwargs,
+        )
+        logger.info(f"Uploaded s3://{self.output_bucket}/{blob_path}")
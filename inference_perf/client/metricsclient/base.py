@@ -13,7 +13,7 @@
 # limitations under the License.
 from abc import ABC, abstractmethod
 from enum import Enum, auto
-from typing import Optional, TypedDict
+from typing import Callable, Dict, Optional, TypedDict, cast
 from pydantic import BaseModel
 
 
@@ -168,6 +168,12 @@ class ModelServerMetrics(BaseModel):
     p99_kv_block_reuse_gap: float = 0.0
 
 
+# Type of each ModelServerMetrics field, used to convert query results
+MODEL_SERVER_METRIC_TYPES: Dict[str, Callable[[float], float]] = {
+    name: cast(Callable[[float], float], field.annotation) for name, field in ModelServerMetrics.model_fields.items()
+}
+
+
 class MetricsClient(ABC):
     @abstractmethod
     def __init__(self) -> None:
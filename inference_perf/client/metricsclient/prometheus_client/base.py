@@ -12,15 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import time
-from typing import List, cast, Any, Optional
+from typing import List, Any, Optional
 import requests
+from urllib3.util.retry import Retry
 from inference_perf.client.modelserver.base import ModelServerPrometheusMetric
 from inference_perf.config import PrometheusClientConfig
-from ..base import MetricsClient, MetricsMetadata, PerfRuntimeParameters, ModelServerMetrics
+from inference_perf.utils import fast_json
+from ..base import MODEL_SERVER_METRIC_TYPES, MetricsClient, MetricsMetadata, PerfRuntimeParameters, ModelServerMetrics
 
 PROMETHEUS_SCRAPE_BUFFER_SEC = 2
+# Queries are independent, so a handful run at once.
+PROMETHEUS_MAX_CONCURRENT_QUERIES = 8
+# Retries for transient gateway errors, sleeping 0.2s, 0.4s and 0.8s in between.
+PROMETHEUS_QUERY_RETRY = Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
 
 logger = logging.getLogger(__name__)
 
@@ -94,92 +101,46 @@ class PrometheusScalarMetric:
         raise Exception(f"query of type {type(self.metric).__name__}, does not contain the operation {self.op}")
 
 
+# PromQL templates by metric type and query operation. `{v}` is the vector
+# selector (`name{filters}`, or a raw `{...}` selector used as the metric name),
+# `{name}`/`{filter}` are substituted as-is and `{d}` is the duration in seconds.
+_QUERY_TEMPLATES: dict[str, dict[str, str]] = {
+    "gauge": {
+        "mean": "avg_over_time({v}[{d}s])",
+        "median": "quantile_over_time(0.5, {v}[{d}s])",
+        "sd": "stddev_over_time({v}[{d}s])",
+        "min": "min_over_time({v}[{d}s])",
+        "max": "max_over_time({v}[{d}s])",
+        "p90": "quantile_over_time(0.9, {v}[{d}s])",
+        "p99": "quantile_over_time(0.99, {v}[{d}s])",
+    },
+    "histogram": {
+        "mean": "sum(rate({name}_sum{{{filter}}}[{d}s])) / (sum(rate({name}_count{{{filter}}}[{d}s])) > 0)",
+        "increase": "sum(increase({name}_count{{{filter}}}[{d}s]))",
+        "rate": "sum(rate({name}_count{{{filter}}}[{d}s]))",
+        "median": "histogram_quantile(0.5, sum(rate({name}_bucket{{{filter}}}[{d}s])) by (le))",
+        "min": "histogram_quantile(0, sum(rate({name}_bucket{{{filter}}}[{d}s])) by (le))",
+        "max": "histogram_quantile(1, sum(rate({name}_bucket{{{filter}}}[{d}s])) by (le))",
+        "p90": "histogram_quantile(0.9, sum(rate({name}_bucket{{{filter}}}[{d}s])) by (le))",
+        "p99": "histogram_quantile(0.99, sum(rate({name}_bucket{{{filter}}}[{d}s])) by (le))",
+    },
+    "counter": {
+        "rate": "sum(rate({v}[{d}s]))",
+        "increase": "sum(increase({v}[{d}s]))",
+        "mean": "avg_over_time(rate({v}[{d}s])[{d}s:{d}s])",
+        "max": "max_over_time(rate({v}[{d}s])[{d}s:{d}s])",
+        "min": "min_over_time(rate({v}[{d}s])[{d}s:{d}s])",
+        "p90": "quantile_over_time(0.9, rate({v}[{d}s])[{d}s:{d}s])",
+        "p99": "quantile_over_time(0.99, rate({v}[{d}s])[{d}s:{d}s])",
+    },
+}
+
+
 class PrometheusQueryBuilder:
     def __init__(self, model_server_metric: ModelServerPrometheusMetric, duration: float):
         self.model_server_metric = model_server_metric
         self.duration = duration
 
-    def get_queries(self) -> dict[str, dict[str, str]]:
-        """
-        Returns a dictionary of queries for each metric type.
-        """
-        metric_name = self.model_server_metric.name
-        filter = self.model_server_metric.filters
-
-        use_selector = False
-        if metric_name.startswith("{") and metric_name.endswith("}"):
-            use_selector = True
-            if filter:
-                selector = f"{metric_name[:-1]},{filter}}}"
-            else:
-                selector = metric_name
-
-        queries = {
-            "gauge": {
-                "mean": "avg_over_time(%s{%s}[%.0fs])" % (metric_name, filter, self.duration),
-                "median": "quantile_over_time(0.5, %s{%s}[%.0fs])" % (metric_name, filter, self.duration),
-                "sd": "stddev_over_time(%s{%s}[%.0fs])" % (metric_name, filter, self.duration),
-                "min": "min_over_time(%s{%s}[%.0fs])" % (metric_name, filter, self.duration),
-                "max": "max_over_time(%s{%s}[%.0fs])" % (metric_name, filter, self.duration),
-                "p90": "quantile_over_time(0.9, %s{%s}[%.0fs])" % (metric_name, filter, self.duration),
-                "p99": "quantile_over_time(0.99, %s{%s}[%.0fs])" % (metric_name, filter, self.duration),
-            },
-            "histogram": {
-                "mean": "sum(rate(%s_sum{%s}[%.0fs])) / (sum(rate(%s_count{%s}[%.0fs])) > 0)"
-                % (metric_name, filter, self.duration, metric_name, filter, self.duration),
-                "increase": "sum(increase(%s_count{%s}[%.0fs]))" % (metric_name, filter, self.duration),
-                "rate": "sum(rate(%s_count{%s}[%.0fs]))" % (metric_name, filter, self.duration),
-                "median": "histogram_quantile(0.5, sum(rate(%s_bucket{%s}[%.0fs])) by (le))"
-                % (metric_name, filter, self.duration),
-                "min": "histogram_quantile(0, sum(rate(%s_bucket{%s}[%.0fs])) by (le))" % (metric_name, filter, self.duration),
-                "max": "histogram_quantile(1, sum(rate(%s_bucket{%s}[%.0fs])) by (le))" % (metric_name, filter, self.duration),
-                "p90": "histogram_quantile(0.9, sum(rate(%s_bucket{%s}[%.0fs])) by (le))"
-                % (metric_name, filter, self.duration),
-                "p99": "histogram_quantile(0.99, sum(rate(%s_bucket{%s}[%.0fs])) by (le))"
-                % (metric_name, filter, self.duration),
-            },
-            "counter": {
-                "rate": "sum(rate(%s{%s}[%.0fs]))" % (metric_name, filter, self.duration),
-                "increase": "sum(increase(%s{%s}[%.0fs]))" % (metric_name, filter, self.duration),
-                "mean": "avg_over_time(rate(%s{%s}[%.0fs])[%.0fs:%.0fs])"
-                % (metric_name, filter, self.duration, self.duration, self.duration),
-                "max": "max_over_time(rate(%s{%s}[%.0fs])[%.0fs:%.0fs])"
-                % (metric_name, filter, self.duration, self.duration, self.duration),
-                "min": "min_over_time(rate(%s{%s}[%.0fs])[%.0fs:%.0fs])"
-                % (metric_name, filter, self.duration, self.duration, self.duration),
-                "p90": "quantile_over_time(0.9, rate(%s{%s}[%.0fs])[%.0fs:%.0fs])"
-                % (metric_name, filter, self.duration, self.duration, self.duration),
-                "p99": "quantile_over_time(0.99, rate(%s{%s}[%.0fs])[%.0fs:%.0fs])"
-                % (metric_name, filter, self.duration, self.duration, self.duration),
-            },
-        }
-
-        if use_selector:
-            queries["gauge"] = {
-                "mean": "avg_over_time(%s[%.0fs])" % (selector, self.duration),
-                "median": "quantile_over_time(0.5, %s[%.0fs])" % (selector, self.duration),
-                "sd": "stddev_over_time(%s[%.0fs])" % (selector, self.duration),
-                "min": "min_over_time(%s[%.0fs])" % (selector, self.duration),
-                "max": "max_over_time(%s[%.0fs])" % (selector, self.duration),
-                "p90": "quantile_over_time(0.9, %s[%.0fs])" % (selector, self.duration),
-                "p99": "quantile_over_time(0.99, %s[%.0fs])" % (selector, self.duration),
-            }
-            queries["counter"] = {
-                "rate": "sum(rate(%s[%.0fs]))" % (selector, self.duration),
-                "increase": "sum(increase(%s[%.0fs]))" % (selector, self.duration),
-                "mean": "avg_over_time(rate(%s[%.0fs])[%.0fs:%.0fs])"
-                % (selector, self.duration, self.duration, self.duration),
-                "max": "max_over_time(rate(%s[%.0fs])[%.0fs:%.0fs])" % (selector, self.duration, self.duration, self.duration),
-                "min": "min_over_time(rate(%s[%.0fs])[%.0fs:%.0fs])" % (selector, self.duration, self.duration, self.duration),
-                "p90": "quantile_over_time(0.9, rate(%s[%.0fs])[%.0fs:%.0fs])"
-                % (selector, self.duration, self.duration, self.duration),
-                "p99": "quantile_over_time(0.99, rate(%s[%.0fs])[%.0fs:%.0fs])"
-                % (selector, self.duration, self.duration, self.duration),
-            }
-            logger.debug(f"Using raw selector for query: {selector}")
-
-        return queries
-
     def build_query(self) -> str:
         """
         Builds the PromQL query for the given metric type and query operation.
@@ -190,14 +151,24 @@ class PrometheusQueryBuilder:
         metric_type = self.model_server_metric.type
         query_op = self.model_server_metric.op
 
-        queries = self.get_queries()
-        if metric_type not in queries:
+        if metric_type not in _QUERY_TEMPLATES:
             logger.warning("Invalid metric type: %s" % (metric_type))
             return ""
-        if query_op not in queries[metric_type]:
+        if query_op not in _QUERY_TEMPLATES[metric_type]:
             logger.warning("Invalid query operation: %s" % (query_op))
             return ""
-        return queries[metric_type][query_op]
+
+        metric_name = self.model_server_metric.name
+        filter = self.model_server_metric.filters
+        if metric_name.startswith("{") and metric_name.endswith("}"):
+            # The metric name is already a selector, merge the filters into it
+            vector = f"{metric_name[:-1]},{filter}}}" if filter else metric_name
+            logger.debug(f"Using raw selector for query: {vector}")
+        else:
+            vector = f"{metric_name}{{{filter}}}"
+        return _QUERY_TEMPLATES[metric_type][query_op].format(
+            v=vector, name=metric_name, filter=filter, d="%.0f" % self.duration
+        )
 
 
 class PrometheusMetricsClient(MetricsClient):
@@ -208,6 +179,14 @@ class PrometheusMetricsClient(MetricsClient):
             self.query_url = config.url.unicode_string().rstrip("/") + "/api/v1/query"
             logger.debug(f"Prometheus metrics client configured, querying metrics from '{self.query_url}'")
             self.scrape_interval = config.scrape_interval or 30
+            # Keeps connections to Prometheus alive across queries, with one
+            # pooled connection for each query that can be in flight.
+            self.session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_maxsize=PROMETHEUS_MAX_CONCURRENT_QUERIES, max_retries=PROMETHEUS_QUERY_RETRY
+            )
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
         else:
             raise Exception("prometheus config missing")
 
@@ -289,35 +268,50 @@ class PrometheusMetricsClient(MetricsClient):
         if not metrics_metadata:
             logger.warning("Metrics metadata is not present for the runtime")
             return None
-        for summary_metric_name in metrics_metadata:
-            summary_metric_metadata = metrics_metadata.get(summary_metric_name)
-            if summary_metric_metadata is None:
-                logger.warning("Metric metadata is not present for metric: %s. Skipping this metric." % (summary_metric_name))
-                continue
-            summary_metric_metadata = cast(ModelServerPrometheusMetric, summary_metric_metadata)
-            if summary_metric_metadata is None:
+        queries: dict[str, str] = {}
+        for summary_metric_name, summary_metric_metadata in metrics_metadata.items():
+            if not isinstance(summary_metric_metadata, ModelServerPrometheusMetric):
                 logger.warning(
                     "Metric metadata for %s is missing or has an incorrect format. Skipping this metric."
                     % (summary_metric_name)
                 )
                 continue
 
+            if summary_metric_name not in MODEL_SERVER_METRIC_TYPES:
+                logger.warning("Unknown metric: %s. Skipping this metric." % (summary_metric_name))
+                continue
+
             query_builder = PrometheusQueryBuilder(summary_metric_metadata, query_duration)
             query = query_builder.build_query()
             if not query:
                 logger.warning("No query found for metric: %s. Skipping metric." % (summary_metric_name))
                 continue
+            queries[summary_metric_name] = query
+
+        if not queries:
+            return model_server_metrics
+
+        # Execute the queries concurrently, each one is a round trip to Prometheus.
+        # Metrics that map to the same PromQL share a single query.
+        eval_time = str(query_eval_time)
+        distinct_queries = list(dict.fromkeys(queries.values()))
+        with ThreadPoolExecutor(max_workers=min(PROMETHEUS_MAX_CONCURRENT_QUERIES, len(distinct_queries))) as pool:
+            results = dict(
+                zip(
+                    distinct_queries,
+                    pool.map(lambda query: self.execute_query(query, eval_time), distinct_queries),
+                    strict=True,
+                )
+            )
 
-            # Execute the query and get the result
-            result = self.execute_query(query, str(query_eval_time))
+        for summary_metric_name, query in queries.items():
+            result = results[query]
             if result is None:
                 logger.error("Error executing query: %s" % (query))
                 continue
             # Set the result in metrics summary
-            attr = getattr(model_server_metrics, summary_metric_name)
-            if attr is not None:
-                target_type = type(attr)
-                setattr(model_server_metrics, summary_metric_name, target_type(result))
+            target_type = MODEL_SERVER_METRIC_TYPES[summary_metric_name]
+            setattr(model_server_metrics, summary_metric_name, target_type(result))
 
         return model_server_metrics
 
@@ -335,7 +329,7 @@ class PrometheusMetricsClient(MetricsClient):
         query_result = 0.0
         try:
             logger.debug(f"making PromQL query: '{query}'")
-            response = requests.get(self.query_url, headers=self.get_headers(), params={"query": query, "time": eval_time})
+            response = self.session.get(self.query_url, headers=self.get_headers(), params={"query": query, "time": eval_time})
             if response is None:
                 logger.error("error executing query: %s" % (query))
                 return query_result
@@ -363,7 +357,7 @@ class PrometheusMetricsClient(MetricsClient):
         #     }
         # }
 
-        response_obj = response.json()
+        response_obj = fast_json.loads(response.content)
         logger.debug(f"got result for query '{query}': {response_obj}")
         if response_obj.get("status") != "success":
             logger.error("error executing query: %s" % (response_obj))
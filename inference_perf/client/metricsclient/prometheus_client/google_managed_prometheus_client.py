@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import logging
+import threading
 from typing import Any
 from pydantic import HttpUrl
 from inference_perf.client.metricsclient.prometheus_client.base import PrometheusMetricsClient
@@ -33,14 +34,19 @@ class GoogleManagedPrometheusMetricsClient(PrometheusMetricsClient):
         credentials, project_id = google.auth.default()  # type: ignore[no-untyped-call,unused-ignore]
         self.credentials = credentials
         self.project_id = project_id
+        # Prepare an authentication request - helps format the request auth token
+        self._auth_request = google.auth.transport.requests.Request()  # type: ignore[no-untyped-call,unused-ignore]
+        # Queries run concurrently, only one of them refreshes the token.
+        self._credentials_lock = threading.Lock()
         config.url = HttpUrl(f"https://monitoring.googleapis.com/v1/projects/{self.project_id}/location/global/prometheus")
         super().__init__(config)
 
     def get_headers(self) -> dict[str, Any]:
-        # Prepare an authentication request - helps format the request auth token
-        auth_req = google.auth.transport.requests.Request()  # type: ignore[no-untyped-call,unused-ignore]
-
-        self.credentials.refresh(auth_req)  # type: ignore[no-untyped-call,unused-ignore]
-        if not self.credentials.token:
+        with self._credentials_lock:
+            # The token is reused until it is about to expire
+            if not self.credentials.valid:
+                self.credentials.refresh(self._auth_request)  # type: ignore[no-untyped-call,unused-ignore]
+            token = self.credentials.token
+        if not token:
             raise Exception("Failed to get credentials token")
-        return {"Authorization": "Bearer " + self.credentials.token}
+        return {"Authorization": "Bearer " + token}
@@ -19,6 +19,8 @@ from inference_perf.apis import InferenceAPIData
 
 
 class ModelServerPrometheusMetric:
+    __slots__ = ("name", "op", "type", "filters")
+
     def __init__(self, name: str, op: str, type: str, filters: List[str]) -> None:
         self.name = name
         self.op = op
@@ -13,7 +13,7 @@
 # limitations under the License.
 
 from inference_perf.client.requestdatacollector import RequestDataCollector
-from typing import List, Optional
+from typing import Dict, List, Optional
 from inference_perf.config import APIConfig, APIType
 from inference_perf.apis import (
     InferenceAPIData,
@@ -24,11 +24,130 @@ from inference_perf.apis import (
 )
 from .base import ModelServerClient, ModelServerPrometheusMetric, PrometheusMetricMetadata
 import asyncio
+import math
 import time
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Mock responses due within the same tick are released by a single timer.
+MOCK_TIMER_RESOLUTION_SEC = 0.001
+
+# Recorded for requests that time out, matching what a real client records for
+# an asyncio.TimeoutError.
+MOCK_TIMEOUT_ERROR = ErrorResponseInfo(error_msg="", error_type="TimeoutError")
+
+# The mock server reports the same metric for everything it exports, so its
+# metadata is built once and shared by every client.
+MOCK_PROMETHEUS_METRIC = ModelServerPrometheusMetric(
+    name="mock_metric",
+    op="mean",
+    type="counter",
+    filters=[],
+)
+MOCK_PROMETHEUS_METRIC_METADATA = PrometheusMetricMetadata(
+    # Throughput
+    prompt_tokens_per_second=MOCK_PROMETHEUS_METRIC,
+    output_tokens_per_second=MOCK_PROMETHEUS_METRIC,
+    requests_per_second=MOCK_PROMETHEUS_METRIC,
+    # Latency
+    avg_request_latency=MOCK_PROMETHEUS_METRIC,
+    median_request_latency=MOCK_PROMETHEUS_METRIC,
+    p90_request_latency=MOCK_PROMETHEUS_METRIC,
+    p99_request_latency=MOCK_PROMETHEUS_METRIC,
+    # Request
+    total_requests=MOCK_PROMETHEUS_METRIC,
+    avg_prompt_tokens=MOCK_PROMETHEUS_METRIC,
+    avg_output_tokens=MOCK_PROMETHEUS_METRIC,
+    avg_queue_length=MOCK_PROMETHEUS_METRIC,
+    # Others
+    avg_time_to_first_token=None,
+    median_time_to_first_token=None,
+    p90_time_to_first_token=None,
+    p99_time_to_first_token=None,
+    avg_time_per_output_token=None,
+    median_time_per_output_token=None,
+    p90_time_per_output_token=None,
+    p99_time_per_output_token=None,
+    avg_inter_token_latency=None,
+    median_inter_token_latency=None,
+    p90_inter_token_latency=None,
+    p99_inter_token_latency=None,
+    avg_kv_cache_usage=None,
+    median_kv_cache_usage=None,
+    p90_kv_cache_usage=None,
+    p99_kv_cache_usage=None,
+    num_preemptions_total=None,
+    num_requests_swapped=None,
+    prefix_cache_hits=None,
+    prefix_cache_queries=None,
+    avg_num_requests_running=None,
+    avg_request_queue_time=None,
+    median_request_queue_time=None,
+    p90_request_queue_time=None,
+    p99_request_queue_time=None,
+    avg_request_inference_time=None,
+    median_request_inference_time=None,
+    p90_request_inference_time=None,
+    p99_request_inference_time=None,
+    avg_request_prefill_time=None,
+    median_request_prefill_time=None,
+    p90_request_prefill_time=None,
+    p99_request_prefill_time=None,
+    avg_request_decode_time=None,
+    median_request_decode_time=None,
+    p90_request_decode_time=None,
+    p99_request_decode_time=None,
+    avg_request_prompt_tokens=None,
+    median_request_prompt_tokens=None,
+    p90_request_prompt_tokens=None,
+    p99_request_prompt_tokens=None,
+    avg_request_generation_tokens=None,
+    median_request_generation_tokens=None,
+    p90_request_generation_tokens=None,
+    p99_request_generation_tokens=None,
+    avg_request_max_num_generation_tokens=None,
+    median_request_max_num_generation_tokens=None,
+    p90_request_max_num_generation_tokens=None,
+    p99_request_max_num_generation_tokens=None,
+    avg_request_params_n=None,
+    median_request_params_n=None,
+    p90_request_params_n=None,
+    p99_request_params_n=None,
+    avg_request_params_max_tokens=None,
+    median_request_params_max_tokens=None,
+    p90_request_params_max_tokens=None,
+    p99_request_params_max_tokens=None,
+    request_success_count=None,
+    avg_iteration_tokens=None,
+    median_iteration_tokens=None,
+    p90_iteration_tokens=None,
+    p99_iteration_tokens=None,
+    prompt_tokens_cached=None,
+    prompt_tokens_recomputed=None,
+    external_prefix_cache_hits=None,
+    external_prefix_cache_queries=None,
+    mm_cache_hits=None,
+    mm_cache_queries=None,
+    corrupted_requests=None,
+    avg_request_prefill_kv_computed_tokens=None,
+    median_request_prefill_kv_computed_tokens=None,
+    p90_request_prefill_kv_computed_tokens=None,
+    p99_request_prefill_kv_computed_tokens=None,
+    avg_kv_block_idle_before_evict=None,
+    median_kv_block_idle_before_evict=None,
+    p90_kv_block_idle_before_evict=None,
+    p99_kv_block_idle_before_evict=None,
+    avg_kv_block_lifetime=None,
+    median_kv_block_lifetime=None,
+    p90_kv_block_lifetime=None,
+    p99_kv_block_lifetime=None,
+    avg_kv_block_reuse_gap=None,
+    median_kv_block_reuse_gap=None,
+    p90_kv_block_reuse_gap=None,
+    p99_kv_block_reuse_gap=None,
+)
+
 
 class MockModelServerClient(ModelServerClient):
     def __init__(
@@ -42,6 +161,26 @@ class MockModelServerClient(ModelServerClient):
         self.metrics_collector = metrics_collector
         self.mock_latency = mock_latency
         self.tokenizer = None
+        self._wakeups: Dict[int, asyncio.Event] = {}
+
+    async def _sleep(self, delay: float) -> None:
+        """
+        Sleeps until delay seconds from now, rounded up to the next timer tick.
+
+        Every request waiting for the same tick shares one event and one loop
+        timer, rather than each asyncio.sleep() pushing its own timer onto the
+        loop's heap.
+        """
+        loop = asyncio.get_running_loop()
+        tick = math.ceil((loop.time() + delay) / MOCK_TIMER_RESOLUTION_SEC)
+        wakeup = self._wakeups.get(tick)
+        if wakeup is None:
+            wakeup = self._wakeups[tick] = asyncio.Event()
+            loop.call_at(tick * MOCK_TIMER_RESOLUTION_SEC, self._wake, tick)
+        await wakeup.wait()
+
+    def _wake(self, tick: int) -> None:
+        self._wakeups.pop(tick).set()
 
     async def process_request(
         self, data: InferenceAPIData, stage_id: int, scheduled_time: float, lora_adapter: Optional[str] = None
@@ -49,165 +188,55 @@ class MockModelServerClient(ModelServerClient):
         start = time.perf_counter()
         logger.debug("Processing mock request for stage %d", stage_id)
         effective_model_name = lora_adapter if lora_adapter else "mock_model"
-        try:
-            if self.timeout and self.timeout < self.mock_latency:
-                await asyncio.sleep(self.timeout)
-                raise asyncio.exceptions.TimeoutError()
-            else:
-                if self.mock_latency > 0:
-                    await asyncio.sleep(self.mock_latency)
-
-                info = InferenceInfo(
-                    input_tokens=0,
-                    output_tokens=0,
-                    lora_adapter=lora_adapter,
-                )
-                data.on_completion(info)
-                self.metrics_collector.record_metric(
-                    RequestLifecycleMetric(
-                        stage_id=stage_id,
-                        request_data=str(await data.to_payload(effective_model_name, 3, False, False)),
-                        info=InferenceInfo(
-                            input_tokens=0,
-                            response_info=UnaryInferenceResponseInfo(output_tokens=0),
-                            lora_adapter=lora_adapter,
-                        ),
-                        error=None,
-                        start_time=start,
-                        end_time=time.perf_counter(),
-                        scheduled_time=scheduled_time,
-                    )
-                )
-        except asyncio.exceptions.TimeoutError as e:
+        request_data = str(await data.to_payload(effective_model_name, 3, False, False))
+        if self.timeout and self.timeout < self.mock_latency:
+            await self._sleep(self.timeout)
             logger.debug("Request timedout after %f seconds", self.timeout)
             self.metrics_collector.record_metric(
                 RequestLifecycleMetric(
                     stage_id=stage_id,
-                    request_data=str(data.to_payload(effective_model_name, 3, False, False)),
+                    request_data=request_data,
                     info=InferenceInfo(
                         input_tokens=0,
                         response_info=UnaryInferenceResponseInfo(output_tokens=0),
                         lora_adapter=lora_adapter,
                     ),
-                    error=ErrorResponseInfo(
-                        error_msg=str(e),
-                        error_type=type(e).__name__,
-                    ),
+                    error=MOCK_TIMEOUT_ERROR,
                     start_time=start,
                     end_time=time.perf_counter(),
                     scheduled_time=scheduled_time,
                 )
             )
+            return
+
+        if self.mock_latency > 0:
+            await self._sleep(self.mock_latency)
+
+        info = InferenceInfo(
+            input_tokens=0,
+            output_tokens=0,
+            lora_adapter=lora_adapter,
+        )
+        data.on_completion(info)
+        # The metric is built from known-good values, so skip validation
+        self.metrics_collector.record_metric(
+            RequestLifecycleMetric.model_construct(
+                stage_id=stage_id,
+                request_data=request_data,
+                info=InferenceInfo.model_construct(
+                    input_tokens=0,
+                    response_info=UnaryInferenceResponseInfo.model_construct(output_tokens=0),
+                    lora_adapter=lora_adapter,
+                ),
+                error=None,
+                start_time=start,
+                end_time=time.perf_counter(),
+                scheduled_time=scheduled_time,
+            )
+        )
 
     def get_supported_apis(self) -> List[APIType]:
         return [APIType.Completion, APIType.Chat]
 
     def get_prometheus_metric_metadata(self) -> PrometheusMetricMetadata:
-        mock_prometheus_metric = ModelServerPrometheusMetric(
-            name="mock_metric",
-            op="mean",
-            type="counter",
-            filters=[],
-        )
-        return PrometheusMetricMetadata(
-            # Throughput
-            prompt_tokens_per_second=mock_prometheus_metric,
-            output_tokens_per_second=mock_prometheus_metric,
-            requests_per_second=mock_prometheus_metric,
-            # Latency
-            avg_request_latency=mock_prometheus_metric,
-            median_request_latency=mock_prometheus_metric,
-            p90_request_latency=mock_prometheus_metric,
-            p99_request_latency=mock_prometheus_metric,
-            # Request
-            total_requests=mock_prometheus_metric,
-            avg_prompt_tokens=mock_prometheus_metric,
-            avg_output_tokens=mock_prometheus_metric,
-            avg_queue_length=mock_prometheus_metric,
-            # Others
-            avg_time_to_first_token=None,
-            median_time_to_first_token=None,
-            p90_time_to_first_token=None,
-            p99_time_to_first_token=None,
-            avg_time_per_output_token=None,
-            median_time_per_output_token=None,
-            p90_time_per_output_token=None,
-            p99_time_per_output_token=None,
-            avg_inter_token_latency=None,
-            median_inter_token_latency=None,
-            p90_inter_token_latency=None,
-            p99_inter_token_latency=None,
-            avg_kv_cache_usage=None,
-            median_kv_cache_usage=None,
-            p90_kv_cache_usage=None,
-            p99_kv_cache_usage=None,
-            num_preemptions_total=None,
-            num_requests_swapped=None,
-            prefix_cache_hits=None,
-            prefix_cache_queries=None,
-            avg_num_requests_running=None,
-            avg_request_queue_time=None,
-            median_request_queue_time=None,
-            p90_request_queue_time=None,
-            p99_request_queue_time=None,
-            avg_request_inference_time=None,
-            median_request_inference_time=None,
-            p90_request_inference_time=None,
-            p99_request_inference_time=None,
-            avg_request_prefill_time=None,
-            median_request_prefill_time=None,
-            p90_request_prefill_time=None,
-            p99_request_prefill_time=None,
-            avg_request_decode_time=None,
-            median_request_decode_time=None,
-            p90_request_decode_time=None,
-            p99_request_decode_time=None,
-            avg_request_prompt_tokens=None,
-            median_request_prompt_tokens=None,
-            p90_request_prompt_tokens=None,
-            p99_request_prompt_tokens=None,
-            avg_request_generation_tokens=None,
-            median_request_generation_tokens=None,
-            p90_request_generation_tokens=None,
-            p99_request_generation_tokens=None,
-            avg_request_max_num_generation_tokens=None,
-            median_request_max_num_generation_tokens=None,
-            p90_request_max_num_generation_tokens=None,
-            p99_request_max_num_generation_tokens=None,
-            avg_request_params_n=None,
-            median_request_params_n=None,
-            p90_request_params_n=None,
-            p99_request_params_n=None,
-            avg_request_params_max_tokens=None,
-            median_request_params_max_tokens=None,
-            p90_request_params_max_tokens=None,
-            p99_request_params_max_tokens=None,
-            request_success_count=None,
-            avg_iteration_tokens=None,
-            median_iteration_tokens=None,
-            p90_iteration_tokens=None,
-            p99_iteration_tokens=None,
-            prompt_tokens_cached=None,
-            prompt_tokens_recomputed=None,
-            external_prefix_cache_hits=None,
-            external_prefix_cache_queries=None,
-            mm_cache_hits=None,
-            mm_cache_queries=None,
-            corrupted_requests=None,
-            avg_request_prefill_kv_computed_tokens=None,
-            median_request_prefill_kv_computed_tokens=None,
-            p90_request_prefill_kv_computed_tokens=None,
-            p99_request_prefill_kv_computed_tokens=None,
-            avg_kv_block_idle_before_evict=None,
-            median_kv_block_idle_before_evict=None,
-            p90_kv_block_idle_before_evict=None,
-            p99_kv_block_idle_before_evict=None,
-            avg_kv_block_lifetime=None,
-            median_kv_block_lifetime=None,
-            p90_kv_block_lifetime=None,
-            p99_kv_block_lifetime=None,
-            avg_kv_block_reuse_gap=None,
-            median_kv_block_reuse_gap=None,
-            p90_kv_block_reuse_gap=None,
-            p99_kv_block_reuse_gap=None,
-        )
+        return MOCK_PROMETHEUS_METRIC_METADATA
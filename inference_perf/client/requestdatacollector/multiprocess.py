@@ -14,11 +14,10 @@
 
 import multiprocessing as mp
 
-from asyncio import get_event_loop, create_task
+from asyncio import get_event_loop, create_task, sleep
 from contextlib import asynccontextmanager
 from queue import Empty
-from typing import AsyncIterator, Optional
-from functools import partial
+from typing import AsyncIterator, List, Optional
 import logging
 from inference_perf.client.requestdatacollector import RequestDataCollector
 from inference_perf.apis import RequestLifecycleMetric
@@ -26,6 +25,11 @@ from inference_perf.circuit_breaker import feed_breakers
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on the metrics taken off the queue per executor round trip.
+COLLECTOR_MAX_BATCH_SIZE = 4096
+# Metrics fed to the circuit breakers between yields to the event loop.
+COLLECTOR_YIELD_INTERVAL = 64
+
 
 class MultiprocessRequestDataCollector(RequestDataCollector):
     """Responsible for accumulating client request metrics"""
@@ -36,27 +40,42 @@ class MultiprocessRequestDataCollector(RequestDataCollector):
     def record_metric(self, metric: RequestLifecycleMetric) -> None:
         self.queue.put(metric)
 
+    def _get_batch(self) -> List[Optional[RequestLifecycleMetric]]:
+        """
+        Blocks for the next item, then takes whatever else is already queued.
+
+        Raises Empty if nothing arrives within half a second, so the executor
+        thread is never blocked for too long.
+        """
+        batch = [self.queue.get(timeout=0.5)]
+        while len(batch) < COLLECTOR_MAX_BATCH_SIZE:
+            try:
+                batch.append(self.queue.get_nowait())
+            except Empty:
+                break
+        return batch
+
     async def collect_metrics(self) -> list[RequestLifecycleMetric]:
         metrics: list[RequestLifecycleMetric] = []
         event_loop = get_event_loop()
-        # prevent get from blocking the executor for too long:
-        get_queue = partial(self.queue.get, timeout=0.5)
 
         while True:
             try:
-                item = await event_loop.run_in_executor(None, get_queue)
+                batch = await event_loop.run_in_executor(None, self._get_batch)
             except Empty:
                 continue
 
-            if item is None:
-                self.queue.task_done()
-                break
+            for i, item in enumerate(batch):
+                if i and i % COLLECTOR_YIELD_INTERVAL == 0:
+                    # Evaluating breakers is CPU work, let other tasks run between chunks.
+                    await sleep(0)
+                if item is None:
+                    self.queue.task_done()
+                    return metrics
 
-            metrics.append(item)
-            feed_breakers(item)
-            self.queue.task_done()
-
-        return metrics
+                metrics.append(item)
+                feed_breakers(item)
+                self.queue.task_done()
 
     @asynccontextmanager
     async def start(self) -> AsyncIterator[None]:
@@ -24,6 +24,9 @@ from pydantic import AliasChoices, BaseModel, ConfigDict, Field, HttpUrl, model_
 
 from inference_perf.circuit_breaker import CircuitBreakerConfig
 
+# Prefer the libyaml-backed loader when PyYAML was built with it.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class APIType(Enum):
     Completion = "completion"
@@ -465,10 +468,12 @@ class LoadConfig(BaseModel):
 class StorageConfigBase(BaseModel):
     path: str = f"reports-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
     report_file_prefix: Optional[str] = None
+    pretty: bool = Field(False, description="Indent JSON reports for reading")
 
 
 class GoogleCloudStorageConfig(StorageConfigBase):
     bucket_name: str
+    max_workers: int = Field(16, gt=0, description="Maximum number of reports uploaded concurrently")
 
 
 class SimpleStorageServiceConfig(StorageConfigBase):
@@ -476,6 +481,7 @@ class SimpleStorageServiceConfig(StorageConfigBase):
     endpoint_url: Optional[str] = None
     region_name: Optional[str] = None
     addressing_style: Optional[Literal["auto", "virtual", "path"]] = None
+    max_workers: int = Field(16, gt=0, description="Maximum number of reports uploaded concurrently")
 
 
 class StorageConfig(BaseModel):
@@ -589,7 +595,7 @@ def read_config(config_file: Optional[str] = None, cli_overrides: Optional[dict[
     if config_file:
         logger.info("Using configuration from: %s", config_file)
         with open(config_file, "r") as stream:
-            cfg = yaml.safe_load(stream) or {}
+            cfg = yaml.load(stream, Loader=_YamlLoader) or {}
 
     default_cfg = Config().model_dump(mode="json")
     merged_cfg = deep_merge(default_cfg, cfg)
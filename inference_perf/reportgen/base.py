@@ -53,14 +53,16 @@ def safe_float(value: Any) -> float:
 def summarize(items: List[float], percentiles: List[float]) -> Optional[dict[str, float]]:
     if len(items) == 0:
         return None
+    # Convert the list once, rather than in every numpy call below
+    values = np.asarray(items, dtype=float)
     result = {
-        "mean": float(np.mean(items)),
-        "min": float(np.min(items)),
-        "max": float(np.max(items)),
+        "mean": float(values.mean()),
+        "min": float(values.min()),
+        "max": float(values.max()),
     }
-    for p in percentiles:
+    for p, value in zip(percentiles, np.percentile(values, percentiles), strict=True):
         key = "median" if p == 50 else f"p{p:g}"
-        result[key] = float(np.percentile(items, p))
+        result[key] = float(value)
     return result
 
 
@@ -11,26 +11,83 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from collections import OrderedDict
+from typing import Any, List, Tuple
+
 from transformers import AutoTokenizer, PreTrainedTokenizerBase
 from transformers.tokenization_utils_base import VERY_LARGE_INTEGER
 from inference_perf.config import CustomTokenizerConfig
 
 
 class CustomTokenizer:
+    # Number of recent token counts kept. Prompts are re-counted across session
+    # rounds and retries, and report generation counts the same short chunk
+    # texts over and over.
+    TOKEN_COUNT_CACHE_SIZE = 4096
+
     def __init__(self, config: CustomTokenizerConfig) -> None:
         self.tokenizer: PreTrainedTokenizerBase = AutoTokenizer.from_pretrained(  # type: ignore[no-untyped-call]
             config.pretrained_model_name_or_path, token=config.token, trust_remote_code=config.trust_remote_code
         )
+        # Keyed by (length, hash) rather than the text so large prompts are not retained.
+        self._token_counts: OrderedDict[Tuple[int, int], int] = OrderedDict()
 
     def count_tokens(self, text: str) -> int:
         if text == "":
             return 0
 
+        key = (len(text), hash(text))
+        count = self._token_counts.get(key)
+        if count is not None:
+            self._token_counts.move_to_end(key)
+            return count
+
+        count = self._count_tokens(text)
+        self._token_counts[key] = count
+        if len(self._token_counts) > self.TOKEN_COUNT_CACHE_SIZE:
+            self._token_counts.popitem(last=False)
+        return count
+
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """Counts tokens for several texts, tokenizing the uncached ones in one call."""
+        counts = [0] * len(texts)
+        missing: dict[Tuple[int, int], List[int]] = {}
+        for i, text in enumerate(texts):
+            if text == "":
+                continue
+            key = (len(text), hash(text))
+            count = self._token_counts.get(key)
+            if count is not None:
+                self._token_counts.move_to_end(key)
+                counts[i] = count
+            else:
+                missing.setdefault(key, []).append(i)
+        if not missing:
+            return counts
+
+        indices = list(missing.values())
+        for key, positions, count in zip(
+            missing, indices, self._count_tokens_batch([texts[p[0]] for p in indices]), strict=True
+        ):
+            for i in positions:
+                counts[i] = count
+            self._token_counts[key] = count
+        while len(self._token_counts) > self.TOKEN_COUNT_CACHE_SIZE:
+            self._token_counts.popitem(last=False)
+        return counts
+
+    def _count_tokens(self, text: str) -> int:
+        return len(self._tokenize(text))
+
+    def _count_tokens_batch(self, texts: List[str]) -> List[int]:
+        return [len(ids) for ids in self._tokenize(texts)]
+
+    def _tokenize(self, text: str | List[str]) -> Any:
         # Some tokenizers don't set model_max_length which defaults to VERY_LARGE_INTEGER.
         # Prevent overflow and log spam by skipping truncation.
         if self.tokenizer.model_max_length == VERY_LARGE_INTEGER:
-            return len(self.tokenizer(text).input_ids)
-        return len(self.tokenizer(text, truncation=True, max_length=self.tokenizer.model_max_length).input_ids)
+            return self.tokenizer(text).input_ids
+        return self.tokenizer(text, truncation=True, max_length=self.tokenizer.model_max_length).input_ids
 
     def get_tokenizer(self) -> PreTrainedTokenizerBase:
         return self.tokenizer
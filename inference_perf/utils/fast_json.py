@@ -0,0 +1,74 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import math
+from typing import Any, Union
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """
+    Parses a JSON document, using orjson when it is installed.
+
+    orjson rejects the NaN/Infinity literals that the stdlib encoder emits by
+    default, so any document it refuses is retried with the stdlib parser.
+    Raises json.JSONDecodeError if the document is invalid.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _replace_non_finite(obj: Any) -> Any:
+    """Replaces NaN and Infinity floats with None, as orjson does."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _replace_non_finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_replace_non_finite(value) for value in obj]
+    return obj
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serializes obj to UTF-8 encoded JSON, using orjson when it is installed.
+
+    The output is the same with or without orjson: NaN/Infinity are written
+    as null, non-ASCII text is left unescaped and separators are compact
+    unless indent is set. Objects orjson cannot serialize (e.g. numpy
+    scalars) are retried with the stdlib encoder, which raises TypeError if
+    they are not serializable.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0))
+        except TypeError:
+            pass
+    return json.dumps(
+        _replace_non_finite(obj),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=2 if indent else None,
+        separators=(",", ": ") if indent else (",", ":"),
+    ).encode()
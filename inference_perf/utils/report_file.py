@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any
+from typing import Any, Dict
+
+from . import fast_json
 
 
 class ReportFile:
@@ -23,9 +25,17 @@ class ReportFile:
         self.name = name
         self.contents = contents
         self.file_type = file_type
+        # Serialized contents by indent option, shared by every storage client.
+        self._json: Dict[bool, bytes] = {}
 
     def get_filename(self) -> str:
         return f"{self.name}.{self.file_type}"
 
     def get_contents(self) -> Any:
         return self.contents
+
+    def get_json(self, indent: bool = False) -> bytes:
+        """Returns the contents as UTF-8 JSON, serializing them only once."""
+        if indent not in self._json:
+            self._json[indent] = fast_json.dumps(self.contents, indent=indent)
+        return self._json[indent]
@@ -13,11 +13,13 @@
 # limitations under the License.
 import pytest
 from pathlib import Path
+from typing import Any, Dict, List, Optional
+from inference_perf.analysis import analyze
 from inference_perf.analysis.analyze import (
     analyze_reports,
     _generate_multi_plot,
-    _extract_latency_metric,
-    _extract_throughput_metric,
+    _extract_latency_means_ms,
+    _extract_throughputs,
 )
 from inference_perf.reportgen.base import ResponsesSummary
 
@@ -193,24 +195,57 @@ async def test_analyze_reports(tmp_path: Path, mock_report_data: ResponsesSummar
 
     _generate_multi_plot([], 2, [], "", a)
 
-    assert _extract_latency_metric(mock_report_data.failures["request_latency"], "request_latency") is None
-    assert _extract_latency_metric(mock_report_data.failures["request_latency"], "time_to_first_token") is None
-    assert _extract_latency_metric(mock_report_data.failures["request_latency"], "inter_token_latency") is None
+    assert _extract_latency_means_ms(mock_report_data.successes["latency"]) == [
+        31.12733216257766,
+        7.665923291465091,
+        3.4734172405264743,
+    ]
+    assert _extract_latency_means_ms(mock_report_data.failures["request_latency"]) == [None, None, None]
 
-    assert _extract_latency_metric(mock_report_data.successes["latency"], "request_latency") == 0.48048226445680486
-    assert _extract_latency_metric(mock_report_data.successes["latency"], "time_to_first_token") == 0.03112733216257766
-    assert _extract_latency_metric(mock_report_data.successes["latency"], "inter_token_latency") == 0.003473417240526474
+    assert _extract_throughputs(mock_report_data.successes["throughput"]) == [
+        207.6018611826434,
+        64.23350089997027,
+        271.83536208261364,
+    ]
+    assert _extract_throughputs(mock_report_data.failures["prompt_len"]) == [None, None, None]
 
-    assert _extract_latency_metric(mock_report_data.successes["latency"], "request_latency", True) == 480.48226445680486
-    assert _extract_latency_metric(mock_report_data.successes["latency"], "time_to_first_token", True) == 31.12733216257766
-    assert _extract_latency_metric(mock_report_data.successes["latency"], "inter_token_latency", True) == 3.4734172405264743
 
-    assert _extract_throughput_metric(mock_report_data.failures["prompt_len"], "input_tokens_per_sec") is None
-    assert _extract_throughput_metric(mock_report_data.failures["prompt_len"], "output_tokens_per_sec") is None
-    assert _extract_throughput_metric(mock_report_data.failures["prompt_len"], "total_tokens_per_sec") is None
-    assert _extract_throughput_metric(mock_report_data.failures["prompt_len"], "requests_per_sec") is None
+def test_analyze_reports_reuses_cached_series(
+    tmp_path: Path, mock_report_data: ResponsesSummary, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    r = tmp_path / "test_report"
+    r.mkdir()
+    f = r / "stage_0_lifecycle_metrics.json"
+    f.write_text(mock_report_data.model_dump_json(), encoding="utf-8")
+
+    analyze_reports([r.as_posix()])
+    assert (r / ".analyze_cache.npz").is_file()
+
+    parsed: List[Path] = []
+    original_parse_stage = analyze._parse_stage
+
+    def counting_parse_stage(stage_file: Path) -> Optional[Dict[str, Any]]:
+        parsed.append(stage_file)
+        return original_parse_stage(stage_file)
+
+    monkeypatch.setattr(analyze, "_parse_stage", counting_parse_stage)
+
+    # Unchanged stage files are served from the cache.
+    analyze_reports([r.as_posix()])
+    assert parsed == []
+
+    # A new stage file invalidates the cache.
+    (r / "stage_1_lifecycle_metrics.json").write_text(mock_report_data.model_dump_json(), encoding="utf-8")
+    analyze_reports([r.as_posix()])
+    assert sorted(p.name for p in parsed) == ["stage_0_lifecycle_metrics.json", "stage_1_lifecycle_metrics.json"]
+
+
+def test_analyze_reports_does_not_cache_failed_stages(tmp_path: Path, mock_report_data: ResponsesSummary) -> None:
+    r = tmp_path / "test_report"
+    r.mkdir()
+    (r / "stage_0_lifecycle_metrics.json").write_text(mock_report_data.model_dump_json(), encoding="utf-8")
+    (r / "stage_1_lifecycle_metrics.json").write_text("{not json", encoding="utf-8")
+
+    analyze_reports([r.as_posix()])
 
-    assert _extract_throughput_metric(mock_report_data.successes["throughput"], "input_tokens_per_sec") == 207.6018611826434
-    assert _extract_throughput_metric(mock_report_data.successes["throughput"], "output_tokens_per_sec") == 64.23350089997027
-    assert _extract_throughput_metric(mock_report_data.successes["throughput"], "total_tokens_per_sec") == 271.83536208261364
-    assert _extract_throughput_metric(mock_report_data.successes["throughput"], "requests_per_sec") == 1.0171575756131475
+    assert not (r / ".analyze_cache.npz").exists()
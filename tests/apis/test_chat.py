@@ -11,9 +11,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 from inference_perf.apis.chat import ChatCompletionAPIData, ChatMessage
-from inference_perf.config import APIType
+from inference_perf.config import APIConfig, APIType
 
 
 @pytest.mark.asyncio
@@ -28,3 +30,35 @@ async def test_chat_completion_api_data() -> None:
         "ignore_eos": False,
         "stream": False,
     }
+
+
+@pytest.mark.asyncio
+async def test_chat_completion_api_data_payload_follows_messages() -> None:
+    data = ChatCompletionAPIData(messages=[ChatMessage(role="user", content="Hello, world!")])
+    first = await data.to_payload("test-model", 100, False, False)
+    second = await data.to_payload("test-model", 100, False, True)
+    assert first["messages"] is second["messages"]
+
+    data.messages = [ChatMessage(role="user", content="Bye!")]
+    third = await data.to_payload("test-model", 100, False, False)
+    assert third["messages"] == [{"role": "user", "content": "Bye!"}]
+
+
+@pytest.mark.asyncio
+async def test_chat_completion_api_data_counts_prompt_tokens_once() -> None:
+    data = ChatCompletionAPIData(
+        messages=[ChatMessage(role="system", content="Be brief."), ChatMessage(role="user", content="Hello, world!")]
+    )
+    response = MagicMock()
+    response.json = AsyncMock(return_value={"choices": [{"message": {"content": "Hi"}}]})
+    tokenizer = MagicMock()
+    tokenizer.count_tokens = MagicMock(side_effect=lambda text: len(text.split()))
+    tokenizer.count_tokens_batch = MagicMock(side_effect=lambda texts: [len(text.split()) for text in texts])
+    config = APIConfig(type=APIType.Chat, streaming=False)
+
+    for _ in range(2):
+        info = await data.process_response(response, config, tokenizer)
+        assert info.input_tokens == 4
+    # one batched prompt count, plus one output count per response
+    tokenizer.count_tokens_batch.assert_called_once_with(["Be brief.", "Hello, world!"])
+    assert tokenizer.count_tokens.call_count == 2
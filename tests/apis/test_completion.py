@@ -11,9 +11,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 from inference_perf.apis.completion import CompletionAPIData
-from inference_perf.config import APIType
+from inference_perf.config import APIConfig, APIType
 
 
 @pytest.mark.asyncio
@@ -29,3 +31,23 @@ async def test_completion_api_data() -> None:
         "stream": True,
         "stream_options": {"include_usage": True},
     }
+
+
+@pytest.mark.asyncio
+async def test_completion_api_data_counts_prompt_tokens_once() -> None:
+    data = CompletionAPIData(prompt="Hello, world!")
+    response = MagicMock()
+    response.json = AsyncMock(return_value={"choices": [{"text": "Hi"}]})
+    tokenizer = MagicMock()
+    tokenizer.count_tokens = MagicMock(side_effect=lambda text: len(text.split()))
+    config = APIConfig(type=APIType.Completion, streaming=False)
+
+    for _ in range(2):
+        info = await data.process_response(response, config, tokenizer)
+        assert info.input_tokens == 2
+    # one prompt count, plus one output count per response
+    assert tokenizer.count_tokens.call_count == 3
+
+    data.prompt = "Hello again, world!"
+    info = await data.process_response(response, config, tokenizer)
+    assert info.input_tokens == 3
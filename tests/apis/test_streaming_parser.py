@@ -98,3 +98,64 @@ async def test_parse_sse_stream_timestamps_only_content_events() -> None:
     assert server_usage == {"prompt_tokens": 5, "completion_tokens": 2}, (
         "usage info from a content-less chunk should still be surfaced separately"
     )
+
+
+@pytest.mark.asyncio
+async def test_parse_sse_stream_line_framing() -> None:
+    """Events split across chunks, CRLF line endings and data lines without a
+    space after the colon are all valid SSE; nothing after [DONE] is parsed."""
+    mock_response = Mock()
+    mock_content = Mock()
+    mock_response.content = mock_content
+
+    chunks = [
+        b'data: {"choices": [{"delta": {"con',
+        b'tent": "Hello"}}]}\n',
+        b"\n",
+        b': keep-alive comment\r\n\r\ndata:{"choices": [{"delta": {"content": " world"}}]}\r\n\r',
+        b"\ndata: [DONE]\n\n",
+        b'data: {"choices": [{"delta": {"content": "ignored"}}]}\n\n',
+    ]
+
+    async def mock_iter_any() -> AsyncGenerator[bytes, None]:
+        for chunk in chunks:
+            yield chunk
+
+    mock_content.iter_any = mock_iter_any
+
+    def extract_content(data: dict[str, Any]) -> Optional[str]:
+        return data.get("choices", [{}])[0].get("delta", {}).get("content")  # type: ignore[no-any-return]
+
+    output_text, chunk_times, raw_content, response_chunks, _ = await parse_sse_stream(mock_response, extract_content)
+
+    assert output_text == "Hello world"
+    assert len(chunk_times) == len(response_chunks) == 2
+    assert response_chunks[1] == '{"choices": [{"delta": {"content": " world"}}]}'
+    # the stream is still drained after [DONE]
+    assert "ignored" in raw_content
+
+
+@pytest.mark.asyncio
+async def test_parse_sse_stream_coalesced_events_share_timestamp() -> None:
+    mock_response = Mock()
+    mock_content = Mock()
+    mock_response.content = mock_content
+
+    chunks = [
+        b'data: {"choices": [{"delta": {"content": "a"}}]}\n\ndata: {"choices": [{"delta": {"content": "b"}}]}\n\n',
+        b'data: {"choices": [{"delta": {"content": "c"}}]}\n\n',
+    ]
+
+    async def mock_iter_any() -> AsyncGenerator[bytes, None]:
+        for chunk in chunks:
+            yield chunk
+
+    mock_content.iter_any = mock_iter_any
+
+    def extract_content(data: dict[str, Any]) -> Optional[str]:
+        return data.get("choices", [{}])[0].get("delta", {}).get("content")  # type: ignore[no-any-return]
+
+    output_text, chunk_times, _, _, _ = await parse_sse_stream(mock_response, extract_content)
+
+    assert output_text == "abc"
+    assert chunk_times[0] == chunk_times[1] < chunk_times[2]
@@ -0,0 +1,105 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Any, Dict, List, Optional, Set
+
+import jmespath
+import pytest
+
+from inference_perf.apis import ErrorResponseInfo, InferenceInfo, RequestLifecycleMetric
+from inference_perf.apis.base import StreamedInferenceResponseInfo
+from inference_perf.circuit_breaker.config import CircuitBreakerConfig, MetricsSpec
+from inference_perf.circuit_breaker.simple_breaker import SimpleCircuitBreaker, _root_fields
+from inference_perf.circuit_breaker.triggers.config import TriggerConsecutive
+
+
+@pytest.mark.parametrize(
+    "expression, fields",
+    [
+        # plain field access
+        ("error", {"error"}),
+        ("stage_id == `1`", {"stage_id"}),
+        # nested subexpressions only need their root field
+        ("error.error_type == 'TimeoutError'", {"error"}),
+        ("info.response_info.output_tokens", {"info"}),
+        # filter projections read the projected field, the condition is relative to its elements
+        ("info.response_info.chunk_times[?@ > `2`]", {"info"}),
+        ("errors[?code == `500`].message", {"errors"}),
+        # both sides of || and &&
+        ("error || info.lora_adapter", {"error", "info"}),
+        ("stage_id && !error", {"stage_id", "error"}),
+        # function arguments are evaluated against the document
+        ("length(error.error_msg) > `0`", {"error"}),
+        ("`true`", set()),
+        # the current node needs the whole document
+        ("@", None),
+        ("@.error", None),
+        ("length(@) > `0`", None),
+        ("keys(@)", None),
+        ("error || @", None),
+    ],
+)
+def test_root_fields(expression: str, fields: Optional[Set[str]]) -> None:
+    assert _root_fields(jmespath.compile(expression).parsed) == fields
+
+
+def _breaker(matches: List[str], rules: Optional[List[str]] = None) -> SimpleCircuitBreaker:
+    return SimpleCircuitBreaker(
+        CircuitBreakerConfig(
+            name="test",
+            metrics=MetricsSpec(matches=matches, rules=rules or []),
+            triggers=[TriggerConsecutive(type="consecutive", threshold=1)],
+        )
+    )
+
+
+def _metric(error: Optional[ErrorResponseInfo] = None) -> RequestLifecycleMetric:
+    return RequestLifecycleMetric(
+        stage_id=1,
+        request_data="{}",
+        info=InferenceInfo(
+            input_tokens=3,
+            lora_adapter="adapter",
+            response_info=StreamedInferenceResponseInfo(chunk_times=[1.0, 2.5, 4.0], output_tokens=3),
+        ),
+        error=error,
+        start_time=0.0,
+        end_time=1.0,
+        scheduled_time=0.0,
+    )
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "stage_id == `1`",
+        "error.error_type == 'TimeoutError'",
+        "length(info.response_info.chunk_times[?@ > `2`]) == `2`",
+        "error || info.lora_adapter == 'other'",
+        "length(keys(@)) > `5`",
+    ],
+)
+@pytest.mark.parametrize("error", [None, ErrorResponseInfo(error_type="TimeoutError", error_msg="")])
+def test_feed_matches_full_document(expression: str, error: Optional[ErrorResponseInfo]) -> None:
+    metric = _metric(error)
+    full: Dict[str, Any] = metric.model_dump(mode="json", exclude_unset=True, exclude_none=True)
+    breaker = _breaker([expression])
+
+    breaker.feed(metric)
+
+    assert breaker.is_open() == bool(jmespath.search(expression, full))
+
+
+def test_current_node_serializes_whole_metric() -> None:
+    assert _breaker(["error"], ["stage_id == `1`"])._fields == {"error", "stage_id"}
+    assert _breaker(["error"], ["@.stage_id == `1`"])._fields is None
@@ -0,0 +1,76 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import threading
+from typing import Any, Dict, Optional, Set
+
+import pytest
+from google.api_core.exceptions import PreconditionFailed
+
+from inference_perf.client.filestorage.gcs import GoogleCloudStorageClient
+from inference_perf.config import GoogleCloudStorageConfig
+from inference_perf.utils import ReportFile
+
+
+class FakeBlob:
+    def __init__(self, bucket: "FakeBucket", name: str) -> None:
+        self.bucket = bucket
+        self.name = name
+
+    def upload_from_string(self, data: bytes, content_type: str, if_generation_match: Optional[int] = None) -> None:
+        with self.bucket.lock:
+            if if_generation_match == 0 and self.name in self.bucket.existing:
+                raise PreconditionFailed("object exists")  # type: ignore[no-untyped-call]
+            self.bucket.uploads[self.name] = json.loads(data)
+
+
+class FakeBucket:
+    def __init__(self, existing: Set[str]) -> None:
+        self.existing = existing
+        self.uploads: Dict[str, Any] = {}
+        self.lock = threading.Lock()
+
+    def blob(self, name: str) -> FakeBlob:
+        return FakeBlob(self, name)
+
+
+@pytest.fixture
+def bucket(monkeypatch: pytest.MonkeyPatch) -> FakeBucket:
+    fake_bucket = FakeBucket(existing={"reports/run-existing.json"})
+
+    class FakeClient:
+        def lookup_bucket(self, name: str) -> Any:
+            return fake_bucket
+
+    monkeypatch.setattr("inference_perf.client.filestorage.gcs.storage.Client", FakeClient)
+    return fake_bucket
+
+
+def test_save_report_uploads_new_reports(bucket: FakeBucket) -> None:
+    client = GoogleCloudStorageClient(
+        GoogleCloudStorageConfig(bucket_name="bucket", path="reports", report_file_prefix="run-", max_workers=4)
+    )
+    reports = [ReportFile(f"report_{i}", {"i": i}) for i in range(10)] + [ReportFile("existing", {})]
+
+    client.save_report(reports)
+
+    assert bucket.uploads == {f"reports/run-report_{i}.json": {"i": i} for i in range(10)}
+
+
+def test_save_report_rejects_duplicate_filenames(bucket: FakeBucket) -> None:
+    client = GoogleCloudStorageClient(GoogleCloudStorageConfig(bucket_name="bucket"))
+
+    with pytest.raises(ValueError):
+        client.save_report([ReportFile("summary", {}), ReportFile("summary", {})])
+    assert bucket.uploads == {}
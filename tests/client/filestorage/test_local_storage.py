@@ -0,0 +1,49 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+from pathlib import Path
+
+import yaml
+
+from inference_perf.client.filestorage import LocalStorageClient
+from inference_perf.config import StorageConfigBase
+from inference_perf.utils import ReportFile
+
+
+def test_save_report_writes_json_and_yaml(tmp_path: Path) -> None:
+    client = LocalStorageClient(StorageConfigBase(path=str(tmp_path / "reports"), report_file_prefix="run-"))
+
+    client.save_report(
+        [
+            ReportFile("summary", {"requests": 10}),
+            ReportFile("adapter_org/lora_lifecycle_metrics", {"requests": 3}),
+            ReportFile("config", {"load": {"type": "constant"}}, file_type="yaml"),
+        ]
+    )
+
+    assert json.loads((tmp_path / "reports" / "run-summary.json").read_text()) == {"requests": 10}
+    assert json.loads((tmp_path / "reports" / "run-adapter_org" / "lora_lifecycle_metrics.json").read_text()) == {
+        "requests": 3
+    }
+    assert yaml.safe_load((tmp_path / "reports" / "run-config.yaml").read_text()) == {"load": {"type": "constant"}}
+
+
+def test_save_report_indents_only_when_pretty(tmp_path: Path) -> None:
+    report = ReportFile("summary", {"requests": 10})
+
+    LocalStorageClient(StorageConfigBase(path=str(tmp_path / "compact"))).save_report([report])
+    LocalStorageClient(StorageConfigBase(path=str(tmp_path / "pretty"), pretty=True)).save_report([report])
+
+    assert "\n" not in (tmp_path / "compact" / "summary.json").read_text()
+    assert (tmp_path / "pretty" / "summary.json").read_text().splitlines()[1] == '  "requests": 10'
@@ -0,0 +1,120 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+from typing import Any, Dict, List, Optional, Set
+
+import pytest
+from botocore.exceptions import ClientError
+
+from inference_perf.client.filestorage.s3 import SimpleStorageServiceClient
+from inference_perf.config import SimpleStorageServiceConfig
+from inference_perf.utils import ReportFile
+
+
+class FakeS3Client:
+    class exceptions:
+        ClientError = ClientError
+
+    def __init__(self, existing: Set[str]) -> None:
+        self.existing = existing
+        self.uploads: Dict[str, Any] = {}
+        self.error_code = "PreconditionFailed"
+        self.supports_conditional_put = True
+        self.conditional_puts = 0
+
+    def head_object(self, Bucket: str, Key: str) -> None:
+        if Key not in self.existing:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes, ContentType: str, IfNoneMatch: Optional[str] = None) -> None:
+        if IfNoneMatch is not None:
+            assert IfNoneMatch == "*"
+            self.conditional_puts += 1
+            if not self.supports_conditional_put:
+                raise ClientError(
+                    {"Error": {"Code": "NotImplemented"}, "ResponseMetadata": {"HTTPStatusCode": 501}}, "PutObject"
+                )
+            if Key in self.existing:
+                raise ClientError({"Error": {"Code": self.error_code}}, "PutObject")
+        self.uploads[Key] = json.loads(Body)
+
+
+@pytest.fixture
+def s3(monkeypatch: pytest.MonkeyPatch) -> FakeS3Client:
+    fake_client = FakeS3Client(existing={"reports/run-existing.json", "reports/run-other.json"})
+    monkeypatch.setattr("inference_perf.client.filestorage.s3.boto3.client", lambda *args, **kwargs: fake_client)
+    return fake_client
+
+
+def _reports() -> List[ReportFile]:
+    return [ReportFile("summary", {"ok": True}), ReportFile("existing", {}), ReportFile("other", {})]
+
+
+def test_save_report_does_not_overwrite_existing_keys(s3: FakeS3Client) -> None:
+    client = SimpleStorageServiceClient(
+        SimpleStorageServiceConfig(bucket_name="bucket", path="reports", report_file_prefix="run-")
+    )
+
+    client.save_report(_reports())
+
+    assert s3.uploads == {"reports/run-summary.json": {"ok": True}}
+
+
+def test_save_report_continues_after_failed_upload(s3: FakeS3Client) -> None:
+    s3.error_code = "AccessDenied"
+    s3.existing = {"reports/existing.json"}
+    client = SimpleStorageServiceClient(SimpleStorageServiceConfig(bucket_name="bucket", path="/reports"))
+
+    client.save_report(_reports())
+
+    assert sorted(s3.uploads) == ["reports/other.json", "reports/summary.json"]
+
+
+def test_save_report_falls_back_to_existence_check_without_conditional_writes(s3: FakeS3Client) -> None:
+    s3.supports_conditional_put = False
+    client = SimpleStorageServiceClient(
+        SimpleStorageServiceConfig(bucket_name="bucket", path="reports", report_file_prefix="run-", max_workers=1)
+    )
+
+    client.save_report(_reports())
+    client.save_report([ReportFile("later", {})])
+
+    assert s3.uploads == {"reports/run-summary.json": {"ok": True}, "reports/run-later.json": {}}
+    assert s3.conditional_puts == 1
+    assert not client.conditional_put
+
+
+def test_save_report_checks_existence_on_custom_endpoints(s3: FakeS3Client) -> None:
+    client = SimpleStorageServiceClient(
+        SimpleStorageServiceConfig(
+            bucket_name="bucket", endpoint_url="https://s3.example.com", path="reports", report_file_prefix="run-"
+        )
+    )
+
+    client.save_report(_reports())
+
+    assert s3.uploads == {"reports/run-summary.json": {"ok": True}}
+    assert s3.conditional_puts == 0
+
+
+def test_client_retries_adaptively(monkeypatch: pytest.MonkeyPatch) -> None:
+    client_kwargs: Dict[str, Any] = {}
+    monkeypatch.setattr(
+        "inference_perf.client.filestorage.s3.boto3.client", lambda *args, **kwargs: client_kwargs.update(kwargs)
+    )
+
+    SimpleStorageServiceClient(SimpleStorageServiceConfig(bucket_name="bucket", addressing_style="virtual"))
+
+    assert client_kwargs["config"].retries == {"mode": "adaptive", "max_attempts": 10}
+    assert client_kwargs["config"].s3 == {"addressing_style": "virtual"}
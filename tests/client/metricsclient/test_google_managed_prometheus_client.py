@@ -0,0 +1,50 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Any, Optional, Tuple
+
+import pytest
+
+from inference_perf.client.metricsclient.prometheus_client import GoogleManagedPrometheusMetricsClient
+from inference_perf.config import PrometheusClientConfig
+
+
+class FakeCredentials:
+    def __init__(self) -> None:
+        self.token: Optional[str] = None
+        self.valid = False
+        self.refreshes = 0
+
+    def refresh(self, request: Any) -> None:
+        self.refreshes += 1
+        self.token = f"token-{self.refreshes}"
+        self.valid = True
+
+
+def test_get_headers_refreshes_only_expired_tokens(monkeypatch: pytest.MonkeyPatch) -> None:
+    credentials = FakeCredentials()
+
+    def default() -> Tuple[FakeCredentials, str]:
+        return credentials, "my-project"
+
+    monkeypatch.setattr("google.auth.default", default)
+    client = GoogleManagedPrometheusMetricsClient(PrometheusClientConfig(google_managed=True))
+
+    assert (
+        client.query_url == "https://monitoring.googleapis.com/v1/projects/my-project/location/global/prometheus/api/v1/query"
+    )
+    assert client.get_headers() == {"Authorization": "Bearer token-1"}
+    assert client.get_headers() == {"Authorization": "Bearer token-1"}
+    credentials.valid = False
+    assert client.get_headers() == {"Authorization": "Bearer token-2"}
+    assert credentials.refreshes == 2
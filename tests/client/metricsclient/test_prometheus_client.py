@@ -0,0 +1,117 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import threading
+from typing import Any, Dict, List, cast
+
+from pydantic import HttpUrl
+
+from inference_perf.client.metricsclient.base import MetricsMetadata
+from inference_perf.client.metricsclient.prometheus_client import PrometheusMetricsClient
+from inference_perf.client.metricsclient.prometheus_client.base import PrometheusQueryBuilder
+from inference_perf.client.modelserver.base import ModelServerPrometheusMetric
+from inference_perf.client.modelserver.mock_client import MOCK_PROMETHEUS_METRIC_METADATA
+from inference_perf.config import PrometheusClientConfig
+
+
+class FakeResponse:
+    def __init__(self, body: Dict[str, Any]) -> None:
+        self.content = json.dumps(body).encode()
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class FakeSession:
+    """Answers each query with a value looked up by metric name."""
+
+    def __init__(self, values: Dict[str, str]) -> None:
+        self.values = values
+        self.queries: List[str] = []
+        self.lock = threading.Lock()
+
+    def get(self, url: str, headers: Dict[str, Any], params: Dict[str, str]) -> FakeResponse:
+        with self.lock:
+            self.queries.append(params["query"])
+        value = next(v for name, v in self.values.items() if name in params["query"])
+        return FakeResponse({"status": "success", "data": {"result": [{"value": [float(params["time"]), value]}]}})
+
+
+def _client(values: Dict[str, str]) -> PrometheusMetricsClient:
+    client = PrometheusMetricsClient(PrometheusClientConfig(url=HttpUrl("http://prometheus:9090")))
+    client.session = FakeSession(values)  # type: ignore[assignment]
+    return client
+
+
+def test_get_model_server_metrics_sets_each_result() -> None:
+    client = _client({"vllm:num_requests_waiting": "3.7", "vllm:prompt_tokens_total": "12.5", "vllm:e2e": "0.25"})
+    metadata = cast(
+        MetricsMetadata,
+        {
+            "avg_queue_length": ModelServerPrometheusMetric("vllm:num_requests_waiting", "mean", "gauge", []),
+            "prompt_tokens_per_second": ModelServerPrometheusMetric("vllm:prompt_tokens_total", "rate", "counter", []),
+            "p90_request_latency": ModelServerPrometheusMetric("vllm:e2e", "p90", "histogram", ['model="m"']),
+            "avg_output_tokens": ModelServerPrometheusMetric("vllm:e2e", "unknown_op", "histogram", []),
+            "not_a_metric": ModelServerPrometheusMetric("vllm:num_requests_waiting", "mean", "gauge", []),
+            "avg_time_to_first_token": None,
+        },
+    )
+
+    metrics = client.get_model_server_metrics(metadata, query_duration=60, query_eval_time=1000)
+
+    assert metrics is not None
+    assert metrics.avg_queue_length == 3
+    assert metrics.prompt_tokens_per_second == 12.5
+    assert metrics.p90_request_latency == 0.25
+    assert metrics.avg_output_tokens == 0
+    assert len(cast(FakeSession, client.session).queries) == 3
+
+
+def test_get_model_server_metrics_runs_identical_queries_once() -> None:
+    client = _client({"mock_metric": "2.5"})
+
+    metrics = client.get_model_server_metrics(MOCK_PROMETHEUS_METRIC_METADATA, query_duration=60, query_eval_time=1000)
+
+    assert metrics is not None
+    assert metrics.requests_per_second == 2.5
+    assert metrics.avg_request_latency == 2.5
+    assert metrics.total_requests == 2
+    assert len(cast(FakeSession, client.session).queries) == 1
+
+
+def test_build_query() -> None:
+    def build(name: str, op: str, type: str, filters: List[str]) -> str:
+        return PrometheusQueryBuilder(ModelServerPrometheusMetric(name, op, type, filters), 59.6).build_query()
+
+    assert build("vllm:num_requests_waiting", "mean", "gauge", ['a="1"', 'b="2"']) == (
+        'avg_over_time(vllm:num_requests_waiting{a="1",b="2"}[60s])'
+    )
+    assert build('{__name__="x"}', "p90", "counter", ['a="1"']) == (
+        'quantile_over_time(0.9, rate({__name__="x",a="1"}[60s])[60s:60s])'
+    )
+    assert (
+        build("vllm:e2e", "mean", "histogram", []) == "sum(rate(vllm:e2e_sum{}[60s])) / (sum(rate(vllm:e2e_count{}[60s])) > 0)"
+    )
+    assert build("vllm:e2e", "sd", "histogram", []) == ""
+    assert build("vllm:e2e", "mean", "summary", []) == ""
+
+
+def test_session_retries_gateway_errors() -> None:
+    client = PrometheusMetricsClient(PrometheusClientConfig(url=HttpUrl("http://prometheus:9090")))
+
+    retry = client.session.get_adapter("http://prometheus:9090").max_retries  # type: ignore[attr-defined]
+
+    assert retry.total == 3
+    assert retry.is_retry("GET", 503)
+    assert not retry.is_retry("GET", 400)
@@ -0,0 +1,56 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+
+from inference_perf.apis import CompletionAPIData, RequestLifecycleMetric
+from inference_perf.client.modelserver import MockModelServerClient
+from inference_perf.client.requestdatacollector import LocalRequestDataCollector
+from inference_perf.config import APIConfig
+
+
+async def test_concurrent_requests_share_wakeups() -> None:
+    collector = LocalRequestDataCollector()
+    client = MockModelServerClient(collector, APIConfig(), mock_latency=0.05)
+
+    requests = [client.process_request(CompletionAPIData(prompt="hello"), 0, 0.0) for _ in range(100)]
+    await asyncio.gather(*requests)
+
+    metrics = collector.get_metrics()
+    assert len(metrics) == 100
+    assert all(metric.end_time - metric.start_time >= 0.05 for metric in metrics)
+    assert all(metric.error is None for metric in metrics)
+    assert client._wakeups == {}
+
+
+async def test_recorded_metric_matches_validated_model() -> None:
+    collector = LocalRequestDataCollector()
+    client = MockModelServerClient(collector, APIConfig(), mock_latency=0)
+
+    await client.process_request(CompletionAPIData(prompt="hello"), 2, 0.0, lora_adapter="adapter")
+
+    [metric] = collector.get_metrics()
+    assert metric == RequestLifecycleMetric.model_validate(metric.model_dump())
+    assert metric.info.lora_adapter == "adapter"
+
+
+async def test_timeout_shorter_than_latency() -> None:
+    collector = LocalRequestDataCollector()
+    client = MockModelServerClient(collector, APIConfig(), timeout=0.01, mock_latency=10)
+
+    await asyncio.wait_for(client.process_request(CompletionAPIData(prompt="hello"), 0, 0.0), timeout=1)
+
+    [metric] = collector.get_metrics()
+    assert metric.error is not None
+    assert metric.error.error_type == "TimeoutError"
+    assert "'prompt': 'hello'" in metric.request_data
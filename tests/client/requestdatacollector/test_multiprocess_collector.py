@@ -0,0 +1,47 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import List
+
+import pytest
+
+from inference_perf.apis import InferenceInfo, RequestLifecycleMetric
+from inference_perf.client.requestdatacollector import MultiprocessRequestDataCollector
+
+
+def _metrics(count: int) -> List[RequestLifecycleMetric]:
+    return [
+        RequestLifecycleMetric(
+            stage_id=0,
+            request_data=str(i),
+            info=InferenceInfo(),
+            error=None,
+            start_time=i,
+            end_time=i + 1,
+            scheduled_time=i,
+        )
+        for i in range(count)
+    ]
+
+
+async def test_collects_queued_metrics_in_batches(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("inference_perf.client.requestdatacollector.multiprocess.COLLECTOR_MAX_BATCH_SIZE", 3)
+    monkeypatch.setattr("inference_perf.client.requestdatacollector.multiprocess.COLLECTOR_YIELD_INTERVAL", 2)
+    collector = MultiprocessRequestDataCollector()
+    metrics = _metrics(10)
+
+    async with collector.start():
+        for metric in metrics:
+            collector.record_metric(metric)
+
+    assert [metric.request_data for metric in collector.get_metrics()] == [metric.request_data for metric in metrics]
@@ -0,0 +1,73 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from types import SimpleNamespace
+from typing import Any, List, Union, cast
+
+import pytest
+
+from inference_perf.config import CustomTokenizerConfig
+from inference_perf.utils.custom_tokenizer import CustomTokenizer
+
+
+class WhitespaceTokenizer:
+    model_max_length = 1024
+
+    def __init__(self) -> None:
+        self.calls: List[Union[str, List[str]]] = []
+
+    def __call__(self, text: Union[str, List[str]], **kwargs: Any) -> SimpleNamespace:
+        self.calls.append(text)
+        if isinstance(text, list):
+            return SimpleNamespace(input_ids=[t.split() for t in text])
+        return SimpleNamespace(input_ids=text.split())
+
+
+def _calls(tokenizer: CustomTokenizer) -> List[Union[str, List[str]]]:
+    return cast(WhitespaceTokenizer, tokenizer.get_tokenizer()).calls
+
+
+@pytest.fixture
+def tokenizer(monkeypatch: pytest.MonkeyPatch) -> CustomTokenizer:
+    hf_tokenizer = WhitespaceTokenizer()
+    monkeypatch.setattr(
+        "inference_perf.utils.custom_tokenizer.AutoTokenizer.from_pretrained", lambda *args, **kwargs: hf_tokenizer
+    )
+    return CustomTokenizer(CustomTokenizerConfig(pretrained_model_name_or_path="whitespace"))
+
+
+def test_count_tokens_caches_repeated_texts(tokenizer: CustomTokenizer) -> None:
+    assert tokenizer.count_tokens("a b c") == 3
+    assert tokenizer.count_tokens("a b c") == 3
+    assert tokenizer.count_tokens("d e") == 2
+    assert tokenizer.count_tokens("") == 0
+    assert _calls(tokenizer) == ["a b c", "d e"]
+
+
+def test_count_tokens_evicts_least_recently_used(tokenizer: CustomTokenizer, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(CustomTokenizer, "TOKEN_COUNT_CACHE_SIZE", 2)
+    tokenizer.count_tokens("a")
+    tokenizer.count_tokens("b")
+    tokenizer.count_tokens("a")
+    tokenizer.count_tokens("c")  # evicts "b"
+    tokenizer.count_tokens("a")
+    tokenizer.count_tokens("b")
+    assert _calls(tokenizer) == ["a", "b", "c", "b"]
+
+
+def test_count_tokens_batch_tokenizes_misses_together(tokenizer: CustomTokenizer) -> None:
+    assert tokenizer.count_tokens("a b") == 2
+    assert tokenizer.count_tokens_batch(["a b", "c d e", "", "f", "c d e"]) == [2, 3, 0, 1, 3]
+    assert tokenizer.count_tokens_batch(["f", "c d e"]) == [1, 3]
+    assert tokenizer.count_tokens_batch([]) == []
+    assert _calls(tokenizer) == ["a b", ["c d e", "f"]]
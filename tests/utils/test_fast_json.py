@@ -0,0 +1,68 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import math
+
+import pytest
+
+from inference_perf.utils import fast_json
+
+
+def test_loads_bytes_and_str() -> None:
+    assert fast_json.loads(b'{"a": [1, 2.5, null]}') == {"a": [1, 2.5, None]}
+    assert fast_json.loads('{"a": "b"}') == {"a": "b"}
+
+
+def test_loads_accepts_nan_written_by_stdlib() -> None:
+    data = json.dumps({"mean": float("nan")}).encode()
+    assert math.isnan(fast_json.loads(data)["mean"])
+
+
+def test_loads_raises_stdlib_decode_error() -> None:
+    with pytest.raises(json.JSONDecodeError):
+        fast_json.loads(b"{not json")
+
+
+def test_dumps_round_trips() -> None:
+    data = {"a": [1, 2.5, None, "é"], "b": {"c": True}}
+    assert fast_json.loads(fast_json.dumps(data)) == data
+    assert fast_json.loads(fast_json.dumps(data, indent=True)) == data
+    assert fast_json.loads(fast_json.dumps({1: "a"})) == {"1": "a"}
+
+
+def test_dumps_falls_back_for_unsupported_types() -> None:
+    np = pytest.importorskip("numpy")
+    assert fast_json.loads(fast_json.dumps({"mean": np.float64(1.5)})) == {"mean": 1.5}
+    with pytest.raises(TypeError):
+        fast_json.dumps({"obj": object()})
+
+
+@pytest.mark.parametrize("indent", [False, True])
+def test_dumps_fallback_matches_orjson(monkeypatch: pytest.MonkeyPatch, indent: bool) -> None:
+    pytest.importorskip("orjson")
+    data = {
+        "nan": float("nan"),
+        "inf": [float("inf"), -float("inf"), 1.5],
+        "text": "é ✓",
+        "nested": {"empty": {}, "list": [], "tuple": (1, None, True)},
+        2: "non-str key",
+    }
+    with_orjson = fast_json.dumps(data, indent=indent)
+    monkeypatch.setattr("inference_perf.utils.fast_json.ORJSON_AVAILABLE", False)
+    assert fast_json.dumps(data, indent=indent) == with_orjson
+
+
+def test_dumps_writes_nan_as_null(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("inference_perf.utils.fast_json.ORJSON_AVAILABLE", False)
+    assert fast_json.dumps({"a": float("nan"), "b": "é"}) == '{"a":null,"b":"é"}'.encode()
@@ -0,0 +1,28 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+from unittest.mock import patch
+
+from inference_perf.utils import ReportFile, fast_json
+
+
+def test_get_json_serializes_once_per_format() -> None:
+    report = ReportFile("summary", {"a": [1, 2]})
+    with patch.object(fast_json, "dumps", wraps=fast_json.dumps) as dumps:
+        compact = report.get_json()
+        assert report.get_json() is compact
+        indented = report.get_json(indent=True)
+        assert report.get_json(indent=True) is indented
+    assert dumps.call_count == 2
+    assert json.loads(compact) == json.loads(indented) == {"a": [1, 2]}